@@ -41,6 +41,7 @@ def _load_events_from_db(db: Session, run_id: str) -> List[Dict[str, Any]]:
             "approved": gov.get("decision") == "APPROVED",
             "risk_score": gov.get("risk_score", 0.0),
             "violations": violations,
+            "event_hash": row.hash,
         })
     return events
 
@@ -46,7 +46,7 @@ def test_policy(payload: Dict[str, Any]):
     """Test an action proposal against policies without running a full mission."""
     telemetry = payload.get("telemetry") or {}
     proposal_raw = payload.get("proposal") or {}
-    proposal = ActionProposal(**proposal_raw)
+    proposal = ActionProposal.model_validate(proposal_raw)
     return evaluate_policies(telemetry, proposal)
 
 
@@ -58,7 +58,7 @@ def governance_evaluate(payload: Dict[str, Any]):
     """
     telemetry = payload.get("telemetry") or {}
     proposal_raw = payload.get("proposal") or {}
-    proposal = ActionProposal(**proposal_raw)
+    proposal = ActionProposal.model_validate(proposal_raw)
     return evaluate_policies(telemetry, proposal)
 
 
@@ -9,7 +9,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from app.config import settings
-from app.services.gemini_planner import GeminiPlanner, resolve_bay_from_instruction
+from app.services.gemini_planner import GeminiPlanner, is_stop_instruction, resolve_bay_from_instruction
 from app.services.sim_adapter import SimAdapter
 from app.services.governance_engine import GovernanceEngine
 from app.policies.rules_python import evaluate_policies, GEOFENCE
@@ -134,6 +134,11 @@ def _get_planner() -> GeminiPlanner:
     return _planner
 
 
+def _stop_proposal() -> ActionProposal:
+    """STOP for a bare operator stop command; it needs no planning at all."""
+    return ActionProposal(intent="STOP", params={}, rationale="[fastpath] Stop requested by operator.")
+
+
 @router.get("/models")
 async def list_models():
     """List available Gemini models and the current cascade order."""
@@ -154,6 +159,15 @@ async def generate_plan(body: PlanRequest):
 
     Returns the plan, rationale, and per-waypoint governance results.
     """
+    if is_stop_instruction(body.instruction):
+        return PlanResponse(
+            waypoints=[],
+            rationale=_stop_proposal().rationale,
+            estimated_time_s=0.0,
+            governance=[],
+            all_approved=True,
+        )
+
     # Get current telemetry for context
     try:
         telemetry = await _sim.get_telemetry()
@@ -228,8 +242,34 @@ async def execute_plan(body: ExecuteRequest):
     steps: List[ExecutionStep] = []
     overall_status = "completed"
     audit_records: List[Dict[str, Any]] = []
+    waypoints = body.waypoints
 
-    for idx, wp in enumerate(body.waypoints):
+    if is_stop_instruction(body.instruction):
+        # A bare stop is sent straight to the simulator; any waypoints are ignored
+        waypoints = []
+        try:
+            telemetry = await _sim.get_telemetry()
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"Simulator unreachable: {e}")
+        proposal = _stop_proposal()
+        gov = _gov.evaluate(telemetry, proposal)
+        step = ExecutionStep(
+            waypoint_index=0,
+            waypoint={},
+            governance_decision=gov.decision,
+            policy_state=gov.policy_state,
+            policy_hits=gov.policy_hits,
+            executed=False,
+        )
+        try:
+            step.sim_result = await _sim.send_command({"intent": "STOP", "params": {}})
+            step.executed = True
+        except Exception as e:
+            step.sim_result = {"error": str(e)}
+            overall_status = "partial"
+        steps.append(step)
+
+    for idx, wp in enumerate(waypoints):
         # Get fresh telemetry before each waypoint
         try:
             telemetry = await _sim.get_telemetry()
@@ -440,16 +480,26 @@ async def agentic_propose(body: AgenticProposeRequest):
     if not goal:
         goal = {"x": 15.0, "y": 10.0}
 
-    from app.services.agentic_planner import AgenticPlanner
+    from app.services.agentic_planner import AgenticPlanner, ThoughtStep
     agent = AgenticPlanner()
 
-    try:
-        proposal, thoughts, model = await agent.propose(
-            telemetry, goal, body.instruction, world=world,
-        )
-    except Exception as e:
-        logger.exception("Agentic proposal failed")
-        raise HTTPException(status_code=502, detail=f"Agentic proposal failed: {e}")
+    if is_stop_instruction(body.instruction):
+        proposal, model = _stop_proposal(), "fastpath"
+        thoughts = [ThoughtStep(
+            step_number=1,
+            thought="Operator asked the robot to stop.",
+            action="submit_action",
+            action_input={"intent": "STOP"},
+            observation="Action submitted: STOP {}",
+        )]
+    else:
+        try:
+            proposal, thoughts, model = await agent.propose(
+                telemetry, goal, body.instruction, world=world,
+            )
+        except Exception as e:
+            logger.exception("Agentic proposal failed")
+            raise HTTPException(status_code=502, detail=f"Agentic proposal failed: {e}")
 
     # Governance check
     gov_decision = evaluate_policies(telemetry, proposal)
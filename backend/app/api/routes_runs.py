@@ -14,7 +14,6 @@ from app.db.models import Run, Event, Mission, TelemetrySample
 from app.schemas.run import RunOut, RunStartResponse
 from app.schemas.events import EventOut
 from app.services.run_service import RunService
-from app.services.gemini_planner import GeminiPlanner
 from app.services.local_fallback_planner import generate_fallback_waypoint
 from app.config import settings
 from app.world_model import GEOFENCE
@@ -139,7 +138,7 @@ async def _plan_and_start_loop(svc: RunService, run_id: str, mission_id: str, mi
                     pass
 
                 async with asyncio.timeout(LLM_PLAN_TIMEOUT):
-                    planner = GeminiPlanner()
+                    planner = svc.agent.gemini_planner
                     plan = await planner.generate_plan(telemetry, mission_title, goal)
 
                 if plan and plan.get("waypoints"):
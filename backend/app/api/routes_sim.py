@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.deps import get_db
 from app.db.models import Run, Mission
-from app.schemas.sim import SimWorld, PathPreview, Point
+from app.schemas.sim import SimWorld, PathPreview
 from app.services.sim_adapter import SimAdapter
 from app.services.path_planner import plan_path
 
@@ -84,4 +84,4 @@ async def path_preview(run_id: str, db: Session = Depends(get_db)):
         obstacles=world.get("obstacles", []),
         clearance_m=0.75,
     )
-    return PathPreview(points=[Point(**p) for p in points], note=note)
+    return PathPreview.model_validate({"points": points, "note": note})
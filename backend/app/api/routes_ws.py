@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import Dict, Set
+
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger("app.ws")
@@ -38,8 +39,10 @@ class WsHub:
                     self._clients.pop(run_id, None)
 
     async def broadcast(self, run_id: str, message: dict) -> None:
+        # Serialize once per broadcast; orjson emits UTF-8 (no ASCII escaping)
+        # and handles datetimes natively.
+        payload = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
         # Copy references to avoid mutation while iterating
-        payload = json.dumps(message, ensure_ascii=False)
         async with self._lock:
             clients = list(self._clients.get(run_id, set()))
             # Store for replay to late-connecting clients (skip high-frequency telemetry)
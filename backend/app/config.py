@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import secrets
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -82,6 +82,8 @@ class Settings(BaseSettings):
     gemini_model: str = "gemini-robotics-er-1.5-preview"
     gemini_timeout_s: float = 10.0
     gemini_enabled: bool = False
+    # hedged: race the cascade with staggered starts; sequential: one model at a time
+    gemini_cascade_mode: Literal["hedged", "sequential"] = "hedged"
 
     # ------------------------------------------------------------
     # LLM / Agent Configuration
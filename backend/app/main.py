@@ -119,6 +119,10 @@ async def lifespan(app: FastAPI):
     finally:
         db.close()
     await run_service.sim.close()
+    from app.services.gemini_planner import close_shared_client
+    await close_shared_client()
+    from app.services.mission_service import close_world_client
+    close_world_client()
 
 
 app = FastAPI(
@@ -35,6 +35,43 @@ SOFT_FAIL_POLICIES = frozenset({
     "HITL_05",              # High risk threshold — operator review
 })
 
+# --- Policy bit flags ---
+# One bit per policy ID so hit membership is a single integer AND
+BIT_GEOFENCE_01 = 1 << 0
+BIT_HUMAN_PROXIMITY_02 = 1 << 1
+BIT_WORKER_PROXIMITY_06 = 1 << 2
+BIT_OBSTACLE_CLEARANCE_03 = 1 << 3
+BIT_SAFE_SPEED_01 = 1 << 4
+BIT_HUMAN_CLEARANCE_02 = 1 << 5
+BIT_UNCERTAINTY_04 = 1 << 6
+BIT_HITL_05 = 1 << 7
+
+POLICY_BITS: Dict[str, int] = {
+    "GEOFENCE_01": BIT_GEOFENCE_01,
+    "HUMAN_PROXIMITY_02": BIT_HUMAN_PROXIMITY_02,
+    "WORKER_PROXIMITY_06": BIT_WORKER_PROXIMITY_06,
+    "OBSTACLE_CLEARANCE_03": BIT_OBSTACLE_CLEARANCE_03,
+    "SAFE_SPEED_01": BIT_SAFE_SPEED_01,
+    "HUMAN_CLEARANCE_02": BIT_HUMAN_CLEARANCE_02,
+    "UNCERTAINTY_04": BIT_UNCERTAINTY_04,
+    "HITL_05": BIT_HITL_05,
+}
+HARD_FAIL_MASK = (
+    BIT_GEOFENCE_01 | BIT_HUMAN_PROXIMITY_02 | BIT_WORKER_PROXIMITY_06 | BIT_OBSTACLE_CLEARANCE_03
+)
+
+# Shared result for the common no-hit, zero-risk case (GovernanceDecision is frozen)
+_APPROVED_SAFE = GovernanceDecision(
+    decision="APPROVED",
+    policy_hits=[],
+    reasons=[],
+    required_action=None,
+    risk_score=0.0,
+    policy_state="SAFE",
+    hard_fail=False,
+    hard_fail_policies=[],
+)
+
 
 def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> GovernanceDecision:
     """Evaluate a proposal against a small policy set.
@@ -42,7 +79,24 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
     Returns an APPROVED / DENIED / NEEDS_REVIEW decision with reasons
     and an explicit policy_state (SAFE / SLOW / STOP / REPLAN).
     """
+    # Policy constants bound to locals once per call, so hot-path reads are
+    # LOAD_FAST while still tracking the module values at call time
+    geo_min_x = GEOFENCE["min_x"]
+    geo_max_x = GEOFENCE["max_x"]
+    geo_min_y = GEOFENCE["min_y"]
+    geo_max_y = GEOFENCE["max_y"]
+    zone_limits = ZONE_SPEED_LIMITS
+    min_clearance = MIN_OBSTACLE_CLEARANCE_M
+    min_human_conf = MIN_HUMAN_CONF
+    max_speed_near_human = MAX_SPEED_NEAR_HUMAN
+    min_conf_for_move = MIN_CONF_FOR_MOVE
+    # Proximity checks compare squared distances (no sqrt per worker)
+    stop_r2 = HUMAN_STOP_RADIUS_M * HUMAN_STOP_RADIUS_M
+    slow_r2 = HUMAN_SLOW_RADIUS_M * HUMAN_SLOW_RADIUS_M
+    review_threshold = REVIEW_RISK_THRESHOLD
+
     policy_hits: List[str] = []
+    hit_mask = 0  # POLICY_BITS of everything in policy_hits
     reasons: List[str] = []
     required_action: str | None = None
     # Explicit safety state for the UI
@@ -61,15 +115,15 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
 
     # Consider walking humans (workers) separately if provided by telemetry
     walking_humans = telemetry.get("walking_humans", []) or []
-    nearest_worker_dist = 999.0
+    nearest_worker_d2 = 999.0 * 999.0
     nearest_worker_conf = 0.0
     for wh in walking_humans:
         try:
-            wd = float(wh.get("x", 0))
-            wd_y = float(wh.get("y", 0))
-            d = ((wd - x) ** 2 + (wd_y - y) ** 2) ** 0.5
-            if d < nearest_worker_dist:
-                nearest_worker_dist = d
+            dx = float(wh.get("x", 0)) - x
+            dy = float(wh.get("y", 0)) - y
+            d2 = dx * dx + dy * dy
+            if d2 < nearest_worker_d2:
+                nearest_worker_d2 = d2
                 nearest_worker_conf = float(wh.get("conf", 0.9))
         except Exception:
             continue
@@ -79,8 +133,9 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
     max_speed = float(params.get("max_speed", 0.0)) if intent == "MOVE_TO" else 0.0
 
     # --- GEOFENCE_01 ---
-    if not (GEOFENCE["min_x"] <= x <= GEOFENCE["max_x"] and GEOFENCE["min_y"] <= y <= GEOFENCE["max_y"]):
+    if not (geo_min_x <= x <= geo_max_x and geo_min_y <= y <= geo_max_y):
         policy_hits.append("GEOFENCE_01")
+        hit_mask |= BIT_GEOFENCE_01
         reasons.append(f"Robot out of geofence at ({x:.2f},{y:.2f}).")
         risk_score = max(risk_score, 0.95)
         policy_state = "STOP"
@@ -89,16 +144,18 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
     if intent == "MOVE_TO":
         dest_x = float(params.get("x", x))
         dest_y = float(params.get("y", y))
-        if not (GEOFENCE["min_x"] <= dest_x <= GEOFENCE["max_x"] and GEOFENCE["min_y"] <= dest_y <= GEOFENCE["max_y"]):
-            if "GEOFENCE_01" not in policy_hits:
+        if not (geo_min_x <= dest_x <= geo_max_x and geo_min_y <= dest_y <= geo_max_y):
+            if not hit_mask & BIT_GEOFENCE_01:
                 policy_hits.append("GEOFENCE_01")
+                hit_mask |= BIT_GEOFENCE_01
             reasons.append(f"Proposed destination ({dest_x:.2f},{dest_y:.2f}) is outside geofence.")
             risk_score = max(risk_score, 0.95)
             policy_state = "STOP"
 
     # --- OBSTACLE_CLEARANCE_03 ---
-    if intent == "MOVE_TO" and nearest_obstacle_m < MIN_OBSTACLE_CLEARANCE_M:
+    if intent == "MOVE_TO" and nearest_obstacle_m < min_clearance:
         policy_hits.append("OBSTACLE_CLEARANCE_03")
+        hit_mask |= BIT_OBSTACLE_CLEARANCE_03
         reasons.append(f"Obstacle clearance too low: {nearest_obstacle_m:.2f}m < {MIN_OBSTACLE_CLEARANCE_M:.2f}m.")
         required_action = "Stop and replan with safer clearance."
         risk_score = max(risk_score, 0.9)
@@ -106,14 +163,20 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
 
     # --- HUMAN / WORKER PROXIMITY ---
     # Prefer worker (walking_humans) proximity if one is nearer; otherwise use primary human
-    use_worker = nearest_worker_dist < human_distance_m
-    prox_dist = nearest_worker_dist if use_worker else human_distance_m
+    human_d2 = human_distance_m * human_distance_m if human_distance_m > 0.0 else 0.0
+    use_worker = nearest_worker_d2 < human_d2
+    prox_d2 = nearest_worker_d2 if use_worker else human_d2
     prox_conf = nearest_worker_conf if use_worker else human_conf
     prox_label = "worker" if use_worker else "human"
 
-    if intent == "MOVE_TO" and prox_dist < HUMAN_STOP_RADIUS_M:
-        policy_key = "WORKER_PROXIMITY_06" if use_worker else "HUMAN_PROXIMITY_02"
-        policy_hits.append(policy_key)
+    if intent == "MOVE_TO" and prox_d2 < stop_r2:
+        prox_dist = nearest_worker_d2 ** 0.5 if use_worker else human_distance_m
+        if use_worker:
+            policy_hits.append("WORKER_PROXIMITY_06")
+            hit_mask |= BIT_WORKER_PROXIMITY_06
+        else:
+            policy_hits.append("HUMAN_PROXIMITY_02")
+            hit_mask |= BIT_HUMAN_PROXIMITY_02
         reasons.append(
             f"{prox_label.capitalize()} too close: {prox_dist:.2f}m < stop radius {HUMAN_STOP_RADIUS_M:.1f}m. Full stop required."
         )
@@ -121,11 +184,13 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
         risk_score = max(risk_score, 0.95)
         policy_state = "STOP"
 
-    elif intent == "MOVE_TO" and prox_dist < HUMAN_SLOW_RADIUS_M:
+    elif intent == "MOVE_TO" and prox_d2 < slow_r2:
         # Slow radius: only trigger a policy hit if speed exceeds the safe limit.
         # Use HUMAN_CLEARANCE_02 (SOFT fail) — robot CAN proceed at safe speed.
-        if max_speed > MAX_SPEED_NEAR_HUMAN:
+        if max_speed > max_speed_near_human:
+            prox_dist = nearest_worker_d2 ** 0.5 if use_worker else human_distance_m
             policy_hits.append("HUMAN_CLEARANCE_02")
+            hit_mask |= BIT_HUMAN_CLEARANCE_02
             reasons.append(
                 f"{prox_label.capitalize()} nearby: {prox_dist:.2f}m < slow radius {HUMAN_SLOW_RADIUS_M:.1f}m. "
                 f"Speed {max_speed:.2f} exceeds safe limit {MAX_SPEED_NEAR_HUMAN:.2f}."
@@ -136,8 +201,9 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
                 policy_state = "SLOW"
 
     # --- UNCERTAINTY_04 ---
-    if intent == "MOVE_TO" and human_detected and human_conf < MIN_HUMAN_CONF:
+    if intent == "MOVE_TO" and human_detected and human_conf < min_human_conf:
         policy_hits.append("UNCERTAINTY_04")
+        hit_mask |= BIT_UNCERTAINTY_04
         reasons.append(f"Human detected but confidence too low: {human_conf:.2f} < {MIN_HUMAN_CONF:.2f}.")
         required_action = "Slow down and request operator review; improve perception confidence."
         risk_score = max(risk_score, 0.8)
@@ -146,9 +212,11 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
 
     # --- SAFE_SPEED_01 ---
     if intent == "MOVE_TO":
-        limit = float(ZONE_SPEED_LIMITS.get(zone, 0.5))
+        # world_model already coerces limits to float at load time
+        limit = zone_limits.get(zone, 0.5)
         if max_speed > limit:
             policy_hits.append("SAFE_SPEED_01")
+            hit_mask |= BIT_SAFE_SPEED_01
             reasons.append(f"Speed too high for zone '{zone}': {max_speed:.2f} > {limit:.2f}.")
             required_action = f"Reduce max_speed to <= {limit:.2f}."
             risk_score = max(risk_score, 0.85)
@@ -156,10 +224,11 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
                 policy_state = "SLOW"
 
     # --- HUMAN_CLEARANCE_02 (confidence-based, legacy) ---
-    if intent == "MOVE_TO" and human_detected and human_conf >= MIN_HUMAN_CONF:
-        if max_speed > MAX_SPEED_NEAR_HUMAN:
-            if "HUMAN_PROXIMITY_02" not in policy_hits and "HUMAN_CLEARANCE_02" not in policy_hits:
+    if intent == "MOVE_TO" and human_detected and human_conf >= min_human_conf:
+        if max_speed > max_speed_near_human:
+            if not hit_mask & (BIT_HUMAN_PROXIMITY_02 | BIT_HUMAN_CLEARANCE_02):
                 policy_hits.append("HUMAN_CLEARANCE_02")
+                hit_mask |= BIT_HUMAN_CLEARANCE_02
             reasons.append(f"Human nearby (conf={human_conf:.2f}); max_speed {max_speed:.2f} too high.")
             required_action = f"Reduce max_speed to <= {MAX_SPEED_NEAR_HUMAN:.2f} near humans."
             risk_score = max(risk_score, 0.88)
@@ -167,23 +236,21 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
                 policy_state = "SLOW"
 
     # --- MIN_CONF_FOR_MOVE (part of uncertainty) ---
-    if intent == "MOVE_TO" and telemetry.get("human_detected") and human_conf < MIN_CONF_FOR_MOVE:
+    if intent == "MOVE_TO" and human_detected and human_conf < min_conf_for_move:
         risk_score = max(risk_score, 0.7)
 
     # --- HITL_05 (Human-in-the-loop trigger) ---
-    if risk_score >= REVIEW_RISK_THRESHOLD and not policy_hits:
+    if risk_score >= review_threshold and not hit_mask:
         policy_hits.append("HITL_05")
+        hit_mask |= BIT_HITL_05
         reasons.append(f"Risk score {risk_score:.2f} exceeds review threshold {REVIEW_RISK_THRESHOLD:.2f}; human review required.")
 
     # Decision logic — with hard vs soft failure classification (#14)
-    if policy_hits:
+    if hit_mask:
         # Check if any hard-fail policies triggered
-        has_hard_fail = any(p in HARD_FAIL_POLICIES for p in policy_hits)
-        hard_policies = [p for p in policy_hits if p in HARD_FAIL_POLICIES]
-        soft_policies = [p for p in policy_hits if p in SOFT_FAIL_POLICIES]
-
-        if has_hard_fail:
+        if hit_mask & HARD_FAIL_MASK:
             # Hard failure: always DENIED, no operator override possible
+            hard_policies = [p for p in policy_hits if p in HARD_FAIL_POLICIES]
             return GovernanceDecision(
                 decision="DENIED",
                 policy_hits=policy_hits,
@@ -193,10 +260,11 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
                 policy_state=policy_state,
                 hard_fail=True,
                 hard_fail_policies=hard_policies,
+                policy_bitmask=hit_mask,
             )
 
         # Soft failure: can be upgraded to NEEDS_REVIEW for operator review
-        if risk_score >= REVIEW_RISK_THRESHOLD:
+        if risk_score >= review_threshold:
             return GovernanceDecision(
                 decision="NEEDS_REVIEW",
                 policy_hits=policy_hits,
@@ -206,6 +274,7 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
                 policy_state=policy_state,
                 hard_fail=False,
                 hard_fail_policies=[],
+                policy_bitmask=hit_mask,
             )
         return GovernanceDecision(
             decision="DENIED",
@@ -216,8 +285,11 @@ def evaluate_policies(telemetry: Dict[str, Any], proposal: ActionProposal) -> Go
             policy_state=policy_state,
             hard_fail=False,
             hard_fail_policies=[],
+            policy_bitmask=hit_mask,
         )
 
+    if risk_score == 0.0:
+        return _APPROVED_SAFE
     return GovernanceDecision(
         decision="APPROVED",
         policy_hits=[],
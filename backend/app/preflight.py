@@ -10,6 +10,9 @@ from __future__ import annotations
 import os
 import subprocess
 import time
+from urllib.parse import urlsplit
+
+import orjson
 
 from app.config import settings
 
@@ -32,19 +35,26 @@ def run_migrations(max_retries: int = 5, retry_delay: int = 3) -> None:
             raise RuntimeError(f"Alembic migrations failed after {max_retries} attempts")
 
 
+def mask_database_url(url: str) -> str:
+    """Hide credentials in a database URL: keep scheme, host, port and path only."""
+    u = urlsplit(url)
+    if not (u.username or u.password):
+        return url
+    host = u.hostname or ""
+    if u.port:
+        host = f"{host}:{u.port}"
+    return f"{u.scheme}://***@{host}{u.path}"
+
+
 def main():
     os.makedirs("data", exist_ok=True)
     run_migrations()
-    # Mask credentials in DATABASE_URL
-    db_url = settings.database_url
-    if "@" in db_url:
-        # Hide password: show scheme + host only
-        parts = db_url.split("@")
-        db_url = parts[0].split("://")[0] + "://***@" + parts[-1]
     print("Preflight OK")
-    print(f"DATABASE_URL={db_url}")
-    print(f"SIM_BASE_URL={settings.sim_base_url}")
-    print(f"CORS_ORIGINS={settings.cors_origins}")
+    print(orjson.dumps({
+        "DATABASE_URL": mask_database_url(settings.database_url),
+        "SIM_BASE_URL": settings.sim_base_url,
+        "CORS_ORIGINS": settings.cors_origins,
+    }).decode())
 
 
 if __name__ == "__main__":
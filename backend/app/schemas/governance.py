@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, Dict, List, Literal, Optional
 
 
@@ -14,6 +14,10 @@ class ActionProposal(BaseModel):
 
 
 class GovernanceDecision(BaseModel):
+    # Immutable so the policy engine can hand out shared instances;
+    # use model_copy(update=...) to derive a modified decision.
+    model_config = ConfigDict(frozen=True)
+
     decision: Decision
     policy_hits: List[str] = Field(default_factory=list)
     reasons: List[str] = Field(default_factory=list)
@@ -22,6 +26,8 @@ class GovernanceDecision(BaseModel):
     policy_state: Literal["SAFE", "SLOW", "STOP", "REPLAN"] = "SAFE"
     hard_fail: bool = False
     hard_fail_policies: List[str] = Field(default_factory=list)
+    # policy_hits encoded as rules_python.POLICY_BITS flags
+    policy_bitmask: int = 0
 
 
 class PolicyInfo(BaseModel):
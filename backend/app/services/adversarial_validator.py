@@ -142,7 +142,7 @@ def run_adversarial_suite() -> Dict[str, Any]:
     failed = 0
 
     for scenario in ADVERSARIAL_SCENARIOS:
-        proposal = ActionProposal(**scenario["proposal"])
+        proposal = ActionProposal.model_validate(scenario["proposal"])
         decision = evaluate_policies(scenario["telemetry"], proposal)
 
         checks = []
@@ -203,7 +203,7 @@ def run_holdout_suite() -> Dict[str, Any]:
     failed = 0
 
     for scenario in HOLDOUT_SCENARIOS:
-        proposal = ActionProposal(**scenario["proposal"])
+        proposal = ActionProposal.model_validate(scenario["proposal"])
         decision = evaluate_policies(scenario["telemetry"], proposal)
 
         scenario_passed = True
@@ -3,9 +3,36 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 from app.schemas.governance import ActionProposal, GovernanceDecision
+from app.policies.rules_python import (
+    POLICY_BITS,
+    BIT_GEOFENCE_01,
+    BIT_HUMAN_CLEARANCE_02,
+    BIT_HUMAN_PROXIMITY_02,
+    BIT_OBSTACLE_CLEARANCE_03,
+    BIT_SAFE_SPEED_01,
+    BIT_UNCERTAINTY_04,
+    BIT_WORKER_PROXIMITY_06,
+)
 
 logger = logging.getLogger("app.agent_service")
 
+# Denials that the deterministic agent answers by slowing down
+_SLOWDOWN_MASK = (
+    BIT_SAFE_SPEED_01 | BIT_HUMAN_CLEARANCE_02 | BIT_HUMAN_PROXIMITY_02
+    | BIT_OBSTACLE_CLEARANCE_03 | BIT_UNCERTAINTY_04 | BIT_WORKER_PROXIMITY_06
+)
+# Subset named in the proposal rationale
+_SPEED_REASON_POLICIES = frozenset({
+    "SAFE_SPEED_01", "HUMAN_CLEARANCE_02", "HUMAN_PROXIMITY_02", "OBSTACLE_CLEARANCE_03",
+})
+
+
+def _hits_to_mask(hits: List[str]) -> int:
+    mask = 0
+    for h in hits:
+        mask |= POLICY_BITS.get(h, 0)
+    return mask
+
 
 class SimpleAgent:
     """A tiny agent that proposes actions.
@@ -18,6 +45,8 @@ class SimpleAgent:
     - If last decision was denied/reviewed due to speed, reduce to 0.4
     """
 
+    __slots__ = ("last_adjusted_speed",)
+
     def __init__(self):
         self.last_adjusted_speed: Optional[float] = None
 
@@ -36,16 +65,16 @@ class SimpleAgent:
         # Structured denial feedback: adapt behavior based on governance reasons
         if last_governance:
             decision = last_governance.get("decision", "")
-            hits = set(last_governance.get("policy_hits", []))
-            reasons = last_governance.get("reasons", [])
 
             if decision in ("DENIED", "NEEDS_REVIEW"):
-                if hits & {"SAFE_SPEED_01", "HUMAN_CLEARANCE_02", "HUMAN_PROXIMITY_02",
-                           "OBSTACLE_CLEARANCE_03", "UNCERTAINTY_04", "WORKER_PROXIMITY_06"}:
+                hits = last_governance.get("policy_hits", [])
+                # Decisions from evaluate_policies carry the mask; derive it for older payloads
+                mask = last_governance.get("policy_bitmask") or _hits_to_mask(hits)
+                if mask & _SLOWDOWN_MASK:
                     speed = 0.2  # Well below MAX_SPEED_NEAR_HUMAN (0.4)
-                    rationale_parts.append(f"reduced speed due to: {', '.join(hits & {'SAFE_SPEED_01', 'HUMAN_CLEARANCE_02', 'HUMAN_PROXIMITY_02', 'OBSTACLE_CLEARANCE_03'})}")
+                    rationale_parts.append(f"reduced speed due to: {', '.join(h for h in hits if h in _SPEED_REASON_POLICIES)}")
 
-                if "GEOFENCE_01" in hits:
+                if mask & BIT_GEOFENCE_01:
                     # Clamp target to geofence bounds
                     from app.world_model import GEOFENCE
                     gx = max(GEOFENCE["min_x"] + 0.5, min(gx, GEOFENCE["max_x"] - 0.5))
@@ -68,13 +97,17 @@ class AgentRouter:
     - default    → Deterministic SimpleAgent
     """
 
+    __slots__ = ("simple", "_gemini", "_agentic", "_last_thought_chain")
+
     def __init__(self):
         self.simple = SimpleAgent()
         self._gemini = None
         self._agentic = None
         self._last_thought_chain: List[Dict[str, Any]] = []
 
-    def _gemini_planner(self):
+    @property
+    def gemini_planner(self):
+        """Shared single-call Gemini planner, created on first use."""
         if self._gemini is None:
             from app.services.gemini_planner import GeminiPlanner
             self._gemini = GeminiPlanner()
@@ -143,7 +176,7 @@ class AgentRouter:
         # ── Single-call Gemini mode ──
         if provider == "gemini":
             try:
-                return await self._gemini_planner().propose(telemetry, goal, nl_task, last_governance)
+                return await self.gemini_planner.propose(telemetry, goal, nl_task, last_governance)
             except Exception:
                 return self.simple.propose(telemetry, goal, last_governance)
 
@@ -12,14 +12,18 @@ Unlike the simple GeminiPlanner (single LLM call → JSON), this agent:
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from app.config import settings
+from app.policies.rules_python import evaluate_policies
 from app.schemas.governance import ActionProposal, GovernanceDecision
+from app.services.gemini_planner import GeminiPlanner, _extract_json
 
 logger = logging.getLogger("app.agentic_planner")
 
@@ -55,10 +59,46 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Tool block of the system prompt — static, so rendered once at import
+_TOOL_TEXT = "\n".join(
+    f"  - {t['name']}: {t['description']} Params: {json.dumps(t['parameters'])}"
+    for t in TOOL_DEFINITIONS
+)
+
+# Static part of the agent prompt. Kept ahead of all per-call content so
+# replans and consecutive ticks send an identical leading prefix.
+_PROMPT_PREFIX = f"""You are an autonomous warehouse robot AI planning agent.
+
+TOOLS (use in order: get_world_state → check_policy → submit_action):
+{_TOOL_TEXT}
+
+POLICY RULES:
+- Geofence: x[0-40], y[0-25] — STOP if outside
+- Aisle (y<12): max 0.5 m/s | Loading bay (y>12): max 0.4 m/s
+- Human <1m: STOP | Human <3m: max 0.4 m/s
+- Obstacle clearance: min 0.5m
+
+HARD CONSTRAINTS (never violate):
+- You CANNOT move the robot directly — you only propose actions
+- You CANNOT override or bypass safety policies
+- You MUST accept policy rejections and replan with different parameters
+- If you cannot find a safe plan after retrying, respond with WAIT and rationale "Unable to generate safe plan — recommend manual override"
+"""
+
+_RESPONSE_FORMAT = """Respond with a JSON array of exactly 3 steps:
+[
+  {"thought": "brief assessment", "action": "get_world_state", "action_input": {}},
+  {"thought": "brief policy reasoning", "action": "check_policy", "action_input": {"intent": "MOVE_TO", "x": 15, "y": 10, "max_speed": 0.4}},
+  {"thought": "brief conclusion", "action": "submit_action", "action_input": {"intent": "MOVE_TO", "x": 15, "y": 10, "max_speed": 0.4, "rationale": "Concise reason."}}
+]
+
+Keep each thought under 30 words. ALWAYS check_policy before submit_action.
+"""
+
 
 # ─── Memory entry ──────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class MemoryEntry:
     """Single memory item: what was proposed, what happened, and why."""
     timestamp: float
@@ -69,18 +109,22 @@ class MemoryEntry:
     reasons: List[str]
     policy_state: str
     was_executed: bool
+    # Rendered prompt line; entries aren't modified after they're recorded
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_text(self) -> str:
-        hits = ", ".join(self.policy_hits) if self.policy_hits else "none"
-        reasons_str = "; ".join(self.reasons) if self.reasons else "none"
-        return (
-            f"- Proposed {self.proposal_intent} {self.proposal_params} → "
-            f"{self.governance_decision} (policies: {hits}). "
-            f"Reasons: {reasons_str}. Executed: {self.was_executed}."
-        )
+        if self._text is None:
+            hits = ", ".join(self.policy_hits) if self.policy_hits else "none"
+            reasons_str = "; ".join(self.reasons) if self.reasons else "none"
+            self._text = (
+                f"- Proposed {self.proposal_intent} {self.proposal_params} → "
+                f"{self.governance_decision} (policies: {hits}). "
+                f"Reasons: {reasons_str}. Executed: {self.was_executed}."
+            )
+        return self._text
 
 
-@dataclass
+@dataclass(slots=True)
 class ThoughtStep:
     """One step in the agent's chain of thought."""
     step_number: int
@@ -92,27 +136,47 @@ class ThoughtStep:
 
 # ─── Tool execution (server-side, no LLM needed) ──────────────────────────
 
+def _proposal_key(proposal: ActionProposal) -> tuple:
+    """Hashable identity of a proposal for policy-result reuse."""
+    return (proposal.intent, tuple(sorted(proposal.params.items())))
+
+
 class ToolExecutor:
     """Execute agent tool calls against live environment state."""
 
     def __init__(self, telemetry: Dict[str, Any], world: Optional[Dict[str, Any]] = None):
         self.telemetry = telemetry
         self.world = world or {}
+        # Observations keyed by (tool, params). Telemetry is fixed for the
+        # executor's lifetime, so replans asking the same thing reuse the answer.
+        self._observations: Dict[tuple, str] = {}
+        # Decisions from check_policy, so a matching submit skips re-evaluation
+        self.decisions: Dict[tuple, GovernanceDecision] = {}
 
     def execute(self, tool_name: str, params: Dict[str, Any]) -> str:
         """Run a tool and return observation text."""
-        fn = getattr(self, f"_tool_{tool_name}", None)
+        key = cached = None
+        if isinstance(params, dict):  # the LLM may send any JSON as action_input
+            try:
+                key = (tool_name, tuple(sorted(params.items())))
+                cached = self._observations.get(key)
+            except TypeError:  # unhashable param values from the LLM
+                key = None
+        if cached is not None:
+            return cached
+        fn = self._TOOLS.get(tool_name)
         if not fn:
             return f"Unknown tool: {tool_name}"
         try:
-            return fn(params)
+            observation = fn(self, params)
         except Exception as e:
             return f"Tool error: {e}"
+        if key is not None:
+            self._observations[key] = observation
+        return observation
 
     def _tool_check_policy(self, params: Dict[str, Any]) -> str:
         """Pre-check policy without actually executing."""
-        from app.policies.rules_python import evaluate_policies
-
         proposal = ActionProposal(
             intent=params.get("intent", "MOVE_TO"),
             params={
@@ -123,6 +187,7 @@ class ToolExecutor:
             rationale="Policy pre-check",
         )
         decision = evaluate_policies(self.telemetry, proposal)
+        self.decisions[_proposal_key(proposal)] = decision
         hits = ", ".join(decision.policy_hits) if decision.policy_hits else "none"
         reasons = "; ".join(decision.reasons) if decision.reasons else "none"
         return (
@@ -167,34 +232,52 @@ class ToolExecutor:
             parts.append(f"Bays: {', '.join(bay_strs)}")
         return "\n".join(parts)
 
+    # Tool name → unbound method, resolved once at class definition
+    _TOOLS = {
+        "check_policy": _tool_check_policy,
+        "get_world_state": _tool_get_world_state,
+    }
+
 
 # ─── Agent Memory ──────────────────────────────────────────────────────────
 
+_DENIED_DECISIONS = frozenset({"DENIED", "NEEDS_REVIEW"})
+
+# Speed caps the deterministic fallback applies per zone
+_FALLBACK_ZONE_LIMITS = {"aisle": 0.5, "loading_bay": 0.4, "corridor": 0.7}
+
+
 class AgentMemory:
     """Sliding window of past decisions and outcomes."""
 
     def __init__(self, max_entries: int = 20):
-        self.entries: List[MemoryEntry] = []
+        # deque evicts the oldest entry on append — no list copy per add
+        self.entries: deque[MemoryEntry] = deque(maxlen=max_entries)
         self.max_entries = max_entries
 
     def add(self, entry: MemoryEntry) -> None:
         self.entries.append(entry)
-        if len(self.entries) > self.max_entries:
-            self.entries = self.entries[-self.max_entries:]
+
+    def recent(self, n: int) -> List[MemoryEntry]:
+        """Return the last ``n`` entries, oldest first."""
+        return list(itertools.islice(self.entries, max(0, len(self.entries) - n), None))
 
     def to_context(self) -> str:
         if not self.entries:
             return "No previous decisions."
-        lines = [e.to_text() for e in self.entries[-8:]]  # last 8 for prompt size
+        lines = [e.to_text() for e in self.recent(8)]  # last 8 for prompt size
         return "Recent decision history:\n" + "\n".join(lines)
 
     def denial_count(self, last_n: int = 5) -> int:
-        recent = self.entries[-last_n:]
-        return sum(1 for e in recent if e.governance_decision in ("DENIED", "NEEDS_REVIEW"))
+        start = max(0, len(self.entries) - last_n)
+        return sum(
+            1 for e in itertools.islice(self.entries, start, None)
+            if e.governance_decision in _DENIED_DECISIONS
+        )
 
     def last_denial_reasons(self) -> List[str]:
         for e in reversed(self.entries):
-            if e.governance_decision in ("DENIED", "NEEDS_REVIEW"):
+            if e.governance_decision in _DENIED_DECISIONS:
                 return e.reasons
         return []
 
@@ -214,9 +297,10 @@ class AgenticPlanner:
     MAX_REPLANS = 2     # max times to replan after denial
 
     def __init__(self):
-        from app.services.gemini_planner import GeminiPlanner
         self._llm = GeminiPlanner()
         self.memory = AgentMemory()
+        # The fast cascade is fixed at import; resolve it once, not per attempt
+        self._agent_cascade = self._llm._get_cascade(fast=True)
 
     def _build_system_prompt(
         self,
@@ -227,10 +311,6 @@ class AgenticPlanner:
         denial_feedback: Optional[str] = None,
     ) -> str:
         """Build the ReAct system prompt with tools, memory, and context."""
-        tool_text = "\n".join(
-            f"  - {t['name']}: {t['description']} Params: {json.dumps(t['parameters'])}"
-            for t in TOOL_DEFINITIONS
-        )
         memory_text = self.memory.to_context()
 
         # Build bay directory from world data
@@ -250,7 +330,13 @@ You MUST propose a DIFFERENT action that avoids the denied policies. Do NOT repe
 Consider: different route, lower speed, waiting, or requesting a human override.
 """
 
-        return f"""You are an autonomous warehouse robot AI planning agent.
+        # Static prefix first, then per-world bays, then per-tick state, so
+        # successive prompts share the longest possible leading prefix
+        return f"""{_PROMPT_PREFIX}
+BAY DIRECTORY (use exact coordinates when targeting a bay):
+{bay_text}
+
+IMPORTANT: When the task mentions a bay ID (e.g. B-03, S-01), use the EXACT coordinates from the Bay Directory.
 
 TASK: {nl_task}
 GOAL POSITION: ({goal.get('x', '?')}, {goal.get('y', '?')})
@@ -263,35 +349,7 @@ CURRENT STATE:
 
 {memory_text}
 {denial_text}
-TOOLS (use in order: get_world_state → check_policy → submit_action):
-{tool_text}
-
-POLICY RULES:
-- Geofence: x[0-40], y[0-25] — STOP if outside
-- Aisle (y<12): max 0.5 m/s | Loading bay (y>12): max 0.4 m/s
-- Human <1m: STOP | Human <3m: max 0.4 m/s
-- Obstacle clearance: min 0.5m
-
-BAY DIRECTORY (use exact coordinates when targeting a bay):
-{bay_text}
-
-IMPORTANT: When the task mentions a bay ID (e.g. B-03, S-01), use the EXACT coordinates from the Bay Directory.
-
-HARD CONSTRAINTS (never violate):
-- You CANNOT move the robot directly — you only propose actions
-- You CANNOT override or bypass safety policies
-- You MUST accept policy rejections and replan with different parameters
-- If you cannot find a safe plan after retrying, respond with WAIT and rationale "Unable to generate safe plan — recommend manual override"
-
-Respond with a JSON array of exactly 3 steps:
-[
-  {{"thought": "brief assessment", "action": "get_world_state", "action_input": {{}}}},
-  {{"thought": "brief policy reasoning", "action": "check_policy", "action_input": {{"intent": "MOVE_TO", "x": 15, "y": 10, "max_speed": 0.4}}}},
-  {{"thought": "brief conclusion", "action": "submit_action", "action_input": {{"intent": "MOVE_TO", "x": 15, "y": 10, "max_speed": 0.4, "rationale": "Concise reason."}}}}
-]
-
-Keep each thought under 30 words. ALWAYS check_policy before submit_action.
-"""
+{_RESPONSE_FORMAT}"""
 
     async def propose(
         self,
@@ -310,7 +368,7 @@ Keep each thought under 30 words. ALWAYS check_policy before submit_action.
         denial_feedback = None
 
         # If last governance was a denial, include it as feedback
-        if last_governance and last_governance.get("decision") in ("DENIED", "NEEDS_REVIEW"):
+        if last_governance and last_governance.get("decision") in _DENIED_DECISIONS:
             hits = ", ".join(last_governance.get("policy_hits", []))
             reasons = "; ".join(last_governance.get("reasons", []))
             denial_feedback = f"Decision: {last_governance['decision']}. Policies: {hits}. Reasons: {reasons}."
@@ -323,14 +381,17 @@ Keep each thought under 30 words. ALWAYS check_policy before submit_action.
 
         all_thoughts: List[ThoughtStep] = []
         model_used = "unknown"
+        # One executor for every attempt: telemetry/world don't change between replans
+        tool_exec = ToolExecutor(telemetry, world)
+        # Pre-check results for this telemetry, keyed by (intent, params)
+        pre_checks: Dict[tuple, GovernanceDecision] = {}
 
         for replan_attempt in range(self.MAX_REPLANS + 1):
             prompt = self._build_system_prompt(telemetry, goal, nl_task, world, denial_feedback)
 
             # Race top models concurrently for speed
-            agent_cascade = self._llm._get_cascade(fast=True)
-            logger.info(f"[Agentic] Racing {len(agent_cascade)} models (attempt {replan_attempt + 1})")
-            result_text, model_used = await self._llm._race_models(agent_cascade, prompt)
+            logger.info(f"[Agentic] Racing {len(self._agent_cascade)} models (attempt {replan_attempt + 1})")
+            result_text, model_used = await self._llm._race_models(self._agent_cascade, prompt)
 
             if not result_text:
                 logger.warning("[Agentic] All models failed, falling back to deterministic")
@@ -338,7 +399,6 @@ Keep each thought under 30 words. ALWAYS check_policy before submit_action.
 
             # Parse reasoning steps
             try:
-                from app.services.gemini_planner import _extract_json
                 steps_raw = _extract_json(result_text)
                 if isinstance(steps_raw, dict):
                     steps_raw = [steps_raw]
@@ -347,7 +407,6 @@ Keep each thought under 30 words. ALWAYS check_policy before submit_action.
                 return self._deterministic_fallback(telemetry, goal, denial_feedback), all_thoughts, model_used
 
             # Execute reasoning chain with tools
-            tool_exec = ToolExecutor(telemetry, world)
             proposal = None
 
             for i, step_raw in enumerate(steps_raw[:self.MAX_STEPS]):
@@ -395,8 +454,26 @@ Keep each thought under 30 words. ALWAYS check_policy before submit_action.
                 proposal = self._deterministic_fallback(telemetry, goal, denial_feedback)
 
             # Pre-check governance before returning
-            from app.policies.rules_python import evaluate_policies
-            pre_check = evaluate_policies(telemetry, proposal)
+            key = _proposal_key(proposal)
+            pre_check = pre_checks.get(key)
+            if pre_check is not None and pre_check.decision != "APPROVED":
+                # Same proposal already denied this round — another LLM replan
+                # is unlikely to help, so try the deterministic plan instead
+                logger.info("[Agentic] Repeated denied proposal, using deterministic")
+                proposal = self._deterministic_fallback(telemetry, goal, denial_feedback)
+                model_used = "deterministic"
+                all_thoughts.append(ThoughtStep(
+                    step_number=len(all_thoughts) + 1,
+                    thought="Replan repeated an action that was already pre-denied. Switching to the deterministic planner.",
+                    action="deterministic_fallback",
+                    observation=f"Fallback proposal: {proposal.intent} {proposal.params}",
+                ))
+                key = _proposal_key(proposal)
+                pre_check = pre_checks.get(key)
+            if pre_check is None:
+                # The agent usually ran check_policy on exactly this action
+                pre_check = tool_exec.decisions.get(key) or evaluate_policies(telemetry, proposal)
+                pre_checks[key] = pre_check
 
             if pre_check.decision == "APPROVED":
                 return proposal, all_thoughts, model_used
@@ -481,8 +558,7 @@ Keep each thought under 30 words. ALWAYS check_policy before submit_action.
             speed = min(speed, 0.3)
 
         zone = telemetry.get("zone", "aisle")
-        zone_limits = {"aisle": 0.5, "loading_bay": 0.4, "corridor": 0.7}
-        speed = min(speed, zone_limits.get(zone, 0.5))
+        speed = min(speed, _FALLBACK_ZONE_LIMITS.get(zone, 0.5))
 
         return ActionProposal(
             intent="MOVE_TO",
@@ -503,6 +579,6 @@ Keep each thought under 30 words. ALWAYS check_policy before submit_action.
                     "policy_hits": e.policy_hits,
                     "executed": e.was_executed,
                 }
-                for e in self.memory.entries[-10:]
+                for e in self.memory.recent(10)
             ],
         }
@@ -5,11 +5,53 @@ Generates audit reports for regulatory compliance (ISO 42001, EU AI Act, etc.)
 
 import hashlib
 import json
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from pydantic import BaseModel
 
 
+GENESIS_HASH = "0" * 64
+
+# Runs whose verified audit chain is kept for incremental extension
+_MAX_CACHED_CHAINS = 64
+
+
+def _entry_hash(entry_data: Dict[str, Any], previous_hash: str) -> str:
+    """SHA-256 over the sorted-key JSON of an entry followed by the previous hash.
+
+    Fed to one hasher in two updates — same digest as hashing the
+    concatenated string, without building it.
+    """
+    h = hashlib.sha256(json.dumps(entry_data, sort_keys=True).encode())
+    h.update(previous_hash.encode())
+    return h.hexdigest()
+
+
+def _entry_data(event: Dict[str, Any], default_ts: str) -> Dict[str, Any]:
+    """The fields of an event that go into its audit entry and hash."""
+    return {
+        "timestamp": event.get("timestamp", default_ts),
+        "decision_id": event.get("id", "unknown"),
+        "action_type": event.get("action_type", "unknown"),
+        "approved": event.get("approved", False),
+        "risk_score": event.get("risk_score", 0),
+        "violations": [v.get("policy_id", "") for v in event.get("violations", [])],
+    }
+
+
+def _prefix_digest(events: List[Dict[str, Any]]) -> str:
+    """Digest of the identity of each event: id, timestamp and stored event hash.
+
+    ``event_hash`` is the run event's own chained hash, which commits to its
+    payload, so any rewrite of a stored event changes the digest.
+    """
+    h = hashlib.sha256()
+    for event in events:
+        h.update(f"{event['id']}\x1f{event['timestamp']}\x1f{event.get('event_hash', '')}\x1e".encode())
+    return h.hexdigest()
+
+
 class ComplianceMetrics(BaseModel):
     total_decisions: int = 0
     approved: int = 0
@@ -71,6 +113,9 @@ class ComplianceReportService:
                 "MANAGE: Real-time policy enforcement",
             ],
         }
+        # run_id → (prefix digest of its events, verified audit chain) from
+        # the last report for that run
+        self._chains: Dict[str, Tuple[str, List[AuditEntry]]] = {}
     
     def generate_report(
         self,
@@ -83,15 +128,13 @@ class ComplianceReportService:
         """Generate a compliance report from governance events."""
         
         now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
         
         # Calculate metrics
         metrics = self._calculate_metrics(events)
         
-        # Build audit entries with hash chain
-        audit_entries = self._build_audit_chain(events)
-        
-        # Verify chain integrity
-        chain_valid = self._verify_chain(audit_entries)
+        # Build audit entries with hash chain, reusing the run's verified prefix
+        audit_entries, chain_valid = self._extend_chain(run_id, events, now_iso)
         
         # Get framework mapping
         framework_mapping = {
@@ -100,10 +143,10 @@ class ComplianceReportService:
         
         return ComplianceReport(
             report_id=f"CR-{run_id}-{now.strftime('%Y%m%d%H%M%S')}",
-            generated_at=now.isoformat() + "Z",
+            generated_at=now_iso + "Z",
             run_id=run_id,
-            period_start=(start_time or now).isoformat() + "Z",
-            period_end=(end_time or now).isoformat() + "Z",
+            period_start=(start_time.isoformat() if start_time else now_iso) + "Z",
+            period_end=(end_time.isoformat() if end_time else now_iso) + "Z",
             metrics=metrics,
             audit_entries=audit_entries,
             chain_valid=chain_valid,
@@ -117,25 +160,28 @@ class ComplianceReportService:
             return ComplianceMetrics()
         
         total = len(events)
-        approved = sum(1 for e in events if e.get("approved", False))
-        denied = total - approved
-        
-        risk_scores = [e.get("risk_score", 0) for e in events]
-        avg_risk = sum(risk_scores) / len(risk_scores) if risk_scores else 0
-        max_risk = max(risk_scores) if risk_scores else 0
-        
-        # Count violations by policy
-        violations_by_policy: Dict[str, int] = {}
+        approved = 0
+        risk_sum = 0.0
+        max_risk = float("-inf")
+        violations_by_policy: Counter = Counter()
         critical_count = 0
-        
+
+        # Single pass over events: all reductions here are online
         for event in events:
+            if event.get("approved", False):
+                approved += 1
+            risk = event.get("risk_score", 0)
+            risk_sum += risk
+            if risk > max_risk:
+                max_risk = risk
             for violation in event.get("violations", []):
-                policy_id = violation.get("policy_id", "unknown")
-                violations_by_policy[policy_id] = violations_by_policy.get(policy_id, 0) + 1
-                
+                violations_by_policy[violation.get("policy_id", "unknown")] += 1
                 if violation.get("severity") == "HIGH":
                     critical_count += 1
-        
+
+        denied = total - approved
+        avg_risk = risk_sum / total
+
         return ComplianceMetrics(
             total_decisions=total,
             approved=approved,
@@ -143,32 +189,71 @@ class ComplianceReportService:
             approval_rate=approved / total if total > 0 else 0,
             avg_risk_score=round(avg_risk, 3),
             max_risk_score=round(max_risk, 3),
-            violations_by_policy=violations_by_policy,
+            violations_by_policy=dict(violations_by_policy),
             critical_violations=critical_count,
         )
     
-    def _build_audit_chain(self, events: List[Dict[str, Any]]) -> List[AuditEntry]:
-        """Build audit entries with SHA-256 hash chain."""
+    def _extend_chain(
+        self, run_id: str, events: List[Dict[str, Any]], default_ts: Optional[str] = None
+    ) -> Tuple[List[AuditEntry], bool]:
+        """Return the audit chain for ``events`` and whether it verifies.
+
+        Run events are append-only, so the previous report's chain is reused
+        when ``events`` starts with the same events: every id, timestamp and
+        stored event hash in the prefix must digest to the cached value, and
+        the last cached entry must still hash the same from its event. Only
+        the new tail is then hashed and verified; any mismatch rebuilds from
+        genesis. Runs with events lacking an id or timestamp are never cached.
+        """
+        cached_digest, cached = self._chains.pop(run_id, ("", []))
+        cacheable = all("id" in event and "timestamp" in event for event in events)
+        if (
+            not cacheable
+            or len(cached) > len(events)
+            or (cached and _prefix_digest(events[:len(cached)]) != cached_digest)
+        ):
+            cached = []
+        elif cached:
+            last = cached[-1]
+            boundary = _entry_data(events[len(cached) - 1], last.timestamp)
+            if _entry_hash(boundary, last.previous_hash) != last.hash:
+                cached = []
+
+        previous_hash = cached[-1].hash if cached else GENESIS_HASH
+        tail = self._build_audit_chain(events[len(cached):], previous_hash, default_ts)
+        chain_valid = self._verify_chain(tail, previous_hash)
+        entries = cached + tail
+
+        if chain_valid and cacheable:
+            self._chains[run_id] = (_prefix_digest(events), entries)
+            if len(self._chains) > _MAX_CACHED_CHAINS:
+                self._chains.pop(next(iter(self._chains)))
+        return entries, chain_valid
+
+    def _build_audit_chain(
+        self,
+        events: List[Dict[str, Any]],
+        previous_hash: str = GENESIS_HASH,
+        default_ts: Optional[str] = None,
+    ) -> List[AuditEntry]:
+        """Build audit entries with SHA-256 hash chain.
+
+        Events without a timestamp get ``default_ts`` (now, if not given),
+        taken once for the whole batch.
+        """
+        if default_ts is None:
+            default_ts = datetime.now(timezone.utc).isoformat()
         
         entries = []
-        previous_hash = "0" * 64  # Genesis hash
         
         for event in events:
-            # Create entry data
-            entry_data = {
-                "timestamp": event.get("timestamp", datetime.now(timezone.utc).isoformat()),
-                "decision_id": event.get("id", "unknown"),
-                "action_type": event.get("action_type", "unknown"),
-                "approved": event.get("approved", False),
-                "risk_score": event.get("risk_score", 0),
-                "violations": [v.get("policy_id", "") for v in event.get("violations", [])],
-            }
+            entry_data = _entry_data(event, default_ts)
             
-            # Calculate hash
-            hash_input = json.dumps(entry_data, sort_keys=True) + previous_hash
-            current_hash = hashlib.sha256(hash_input.encode()).hexdigest()
+            current_hash = _entry_hash(entry_data, previous_hash)
             
-            entry = AuditEntry(
+            # Fields come straight from entry_data, which was just hashed:
+            # skip validation so the stored values are exactly what was hashed
+            entry = AuditEntry.model_construct(
                 timestamp=entry_data["timestamp"],
                 decision_id=entry_data["decision_id"],
                 action_type=entry_data["action_type"],
@@ -184,13 +269,12 @@ class ComplianceReportService:
         
         return entries
     
-    def _verify_chain(self, entries: List[AuditEntry]) -> bool:
+    def _verify_chain(self, entries: List[AuditEntry], previous_hash: str = GENESIS_HASH) -> bool:
         """Verify the integrity of the audit chain."""
         
         if not entries:
             return True
         
-        previous_hash = "0" * 64
         
         for entry in entries:
             if entry.previous_hash != previous_hash:
@@ -206,10 +290,7 @@ class ComplianceReportService:
                 "violations": entry.violations,
             }
             
-            hash_input = json.dumps(entry_data, sort_keys=True) + previous_hash
-            calculated_hash = hashlib.sha256(hash_input.encode()).hexdigest()
-            
-            if calculated_hash != entry.hash:
+            if _entry_hash(entry_data, previous_hash) != entry.hash:
                 return False
             
             previous_hash = entry.hash
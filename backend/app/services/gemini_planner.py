@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
+import math
 import re
 import time as _time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import httpx
+import orjson
 
 from app.config import settings
 from app.schemas.governance import ActionProposal
@@ -35,6 +40,14 @@ def resolve_bay_from_instruction(instruction: str, bays: List[Dict[str, Any]]) -
     return None
 
 
+_STOP_INSTRUCTIONS = frozenset({"stop", "halt", "emergency stop", "e-stop", "estop", "stop now"})
+
+
+def is_stop_instruction(instruction: str) -> bool:
+    """True for a bare stop/halt command, which needs no planning at all."""
+    return instruction.strip().strip("!.").strip().lower() in _STOP_INSTRUCTIONS
+
+
 def bay_directory_text(bays: List[Dict[str, Any]]) -> str:
     """Format bay list as a text table for LLM prompts."""
     if not bays:
@@ -45,7 +58,9 @@ def bay_directory_text(bays: List[Dict[str, Any]]) -> str:
         lines.append(f"  {label:20s} → x={b['x']}, y={b['y']}")
     return "\n".join(lines)
 
-_JSON_RE = re.compile(r"(\{.*\}|\[.*\])", re.DOTALL)
+# Candidate starts of a JSON value; the decoder finds where each one ends
+_JSON_START_RE = re.compile(r"[\[{]")
+_JSON_DECODER = json.JSONDecoder()
 
 # Model cascade: flash first (fastest) → robotics-er → heavier models
 MODEL_CASCADE: List[str] = [
@@ -65,13 +80,37 @@ FAST_CASCADE: List[str] = [
 ]
 
 
+def _prompt_json(obj: Any) -> str:
+    """Serialize state/events for embedding in a prompt (compact: whitespace costs tokens)."""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Event fields worth sending to the model; ids and chain hashes carry no signal.
+_PROMPT_EVENT_FIELDS = ("ts", "type", "payload")
+
+
+def _compact_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: event[k] for k in _PROMPT_EVENT_FIELDS if k in event}
+
+
 def _extract_json(text: str) -> Any:
-    """Extract first JSON object/array from a string."""
-    m = _JSON_RE.search(text.strip())
-    if not m:
-        raise ValueError("No JSON found in model output")
-    return json.loads(m.group(1))
+    """Extract first JSON object/array from a string.
+
+    raw_decode parses from each candidate bracket and stops at the end of
+    the value, so markdown fences or trailing prose around it are ignored.
+    """
+    for m in _JSON_START_RE.finditer(text):
+        try:
+            return _JSON_DECODER.raw_decode(text, m.start())[0]
+        except ValueError:
+            continue
+    raise ValueError("No JSON found in model output")
+
 
+_GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+_GENERATION_CONFIG = {"temperature": 0.2}
+# Start the next cascade model if no call has answered within this window
+_HEDGE_DELAY_S = 2.0
 
 # Shared httpx client — reuse connections across calls
 _shared_client: Optional[httpx.AsyncClient] = None
@@ -82,36 +121,113 @@ def _get_shared_client(timeout: float) -> httpx.AsyncClient:
     if _shared_client is None or _shared_client.is_closed:
         _shared_client = httpx.AsyncClient(
             timeout=timeout,
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60.0),
         )
     return _shared_client
 
 
+# Response cache: (model, prompt) digest → (stored_at, text), used by the
+# analysis endpoints only. Planning prompts embed live telemetry (including its
+# timestamp) and never repeat, so they always go upstream. The TTL only
+# coalesces bursts of identical UI requests; hazard and failure analysis must
+# not go stale.
+_RESPONSE_TTL_S = 0.5
+_RESPONSE_CACHE_MAX = 256
+_response_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+# Requests currently on the wire, so identical concurrent calls share one
+_inflight: Dict[bytes, "asyncio.Future[Optional[str]]"] = {}
+
+# Rate-limit cooldowns: model → monotonic time it may be tried again. The
+# backoff doubles on each consecutive 429 and resets on success.
+_COOLDOWN_MIN_S = 5.0
+_COOLDOWN_MAX_S = 300.0
+_cooldown_until: Dict[str, float] = {}
+_cooldown_backoff: Dict[str, float] = {}
+
+
+def _response_key(model: str, prompt: str) -> bytes:
+    return hashlib.blake2b(f"{model}\0{prompt}".encode(), digest_size=16).digest()
+
+
+def _cached_response(key: bytes) -> Optional[str]:
+    hit = _response_cache.get(key)
+    if hit is None:
+        return None
+    stored_at, text = hit
+    if _time.monotonic() - stored_at > _RESPONSE_TTL_S:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return text
+
+
+def _store_response(key: bytes, text: str) -> None:
+    _response_cache[key] = (_time.monotonic(), text)
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > _RESPONSE_CACHE_MAX:
+        _response_cache.popitem(last=False)
+
+
+def _start_cooldown(model: str) -> float:
+    backoff = min(_cooldown_backoff.get(model, _COOLDOWN_MIN_S / 2) * 2, _COOLDOWN_MAX_S)
+    _cooldown_backoff[model] = backoff
+    _cooldown_until[model] = _time.monotonic() + backoff
+    return backoff
+
+
+def _clear_cooldown(model: str) -> None:
+    _cooldown_until.pop(model, None)
+    _cooldown_backoff.pop(model, None)
+
+
+def _is_cooling_down(model: str) -> bool:
+    return _cooldown_until.get(model, 0.0) > _time.monotonic()
+
+
+async def close_shared_client() -> None:
+    """Close the pooled Gemini client (app shutdown)."""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+
+
+@functools.lru_cache(maxsize=4)
+def _build_cascade(primary: str) -> Tuple[str, ...]:
+    """Primary model first, then the rest of MODEL_CASCADE without duplicates."""
+    return tuple(dict.fromkeys([primary, *MODEL_CASCADE]))
+
+
+# Shared read-only stand-in for events without a payload (never mutated)
+_NO_PAYLOAD: Dict[str, Any] = {}
+
+# Keyword fallback for analyze_scene: (keywords, hazard, risk floor), in report order.
+_SCENE_HAZARDS = (
+    (("human", "person", "worker", "people"),
+     {"type": "HUMAN", "severity": "HIGH", "description": "Human presence detected in scene"}, 0.8),
+    (("obstacle", "box", "crate", "pallet", "block"),
+     {"type": "OBSTACLE", "severity": "MEDIUM", "description": "Physical obstacle in path"}, 0.5),
+    (("spill", "wet", "slippery"),
+     {"type": "FLOOR_HAZARD", "severity": "MEDIUM", "description": "Floor hazard detected"}, 0.6),
+)
+
+
 class GeminiPlanner:
     """LLM planner with cascading model fallback and concurrent racing."""
 
     def __init__(self):
         self.api_key = settings.gemini_api_key
+        self._headers = {"x-goog-api-key": self.api_key}  # httpx sets Content-Type for json=
         self.primary_model = settings.gemini_model
         self.timeout_s = min(settings.gemini_timeout_s, 6.0)  # Cap at 6s for speed
-        self.model_cascade = [self.primary_model] + [
-            m for m in MODEL_CASCADE if m != self.primary_model
-        ]
-        # Deduplicate while preserving order
-        seen = set()
-        deduped = []
-        for m in self.model_cascade:
-            if m not in seen:
-                seen.add(m)
-                deduped.append(m)
-        self.model_cascade = deduped
+        self.model_cascade = _build_cascade(self.primary_model)
         self._bays: List[Dict[str, Any]] = []
 
     def set_bays(self, bays: List[Dict[str, Any]]) -> None:
         """Load bay directory for coordinate resolution."""
         self._bays = bays or []
 
-    def _get_cascade(self, preferred_model: Optional[str] = None, fast: bool = False) -> List[str]:
+    def _get_cascade(self, preferred_model: Optional[str] = None, fast: bool = False) -> Sequence[str]:
         """Return model cascade. Use fast=True for latency-sensitive paths."""
         base = FAST_CASCADE if fast else self.model_cascade
         if not preferred_model or preferred_model not in MODEL_CASCADE:
@@ -119,26 +235,64 @@ class GeminiPlanner:
         remaining = [m for m in base if m != preferred_model]
         return [preferred_model] + remaining
 
-    async def _call_gemini(self, model: str, prompt: str) -> Optional[str]:
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
-        headers = {"x-goog-api-key": self.api_key, "Content-Type": "application/json"}
+    async def _call_gemini(self, model: str, prompt: str, cache: bool = False) -> Optional[str]:
+        """Return the model's text for ``prompt``.
+
+        With ``cache``, a recent answer to the same model and prompt is
+        reused and concurrent identical calls wait on a single upstream
+        request. Only successful responses are cached.
+        """
+        if not cache:
+            return await self._post_gemini(model, prompt)
+        key = _response_key(model, prompt)
+        text = _cached_response(key)
+        if text is not None:
+            logger.info(f"Gemini {model} served from response cache")
+            return text
+        while (pending := _inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # this waiter itself was cancelled
+                # The owning call was cancelled; retry instead of reporting a failure
+
+        fut: asyncio.Future[Optional[str]] = asyncio.get_running_loop().create_future()
+        _inflight[key] = fut
+        try:
+            text = await self._post_gemini(model, prompt)
+        except BaseException:
+            fut.cancel()
+            raise
+        else:
+            fut.set_result(text)  # None if this call failed
+        finally:
+            _inflight.pop(key, None)
+        if text:
+            _store_response(key, text)
+        return text
+
+    async def _post_gemini(self, model: str, prompt: str) -> Optional[str]:
+        url = _GEMINI_URL.format(model=model)
         payload = {
             "contents": [{"parts": [{"text": prompt}]}],
-            "generationConfig": {"temperature": 0.2},
+            "generationConfig": _GENERATION_CONFIG,
         }
         t0 = _time.monotonic()
         try:
             client = _get_shared_client(self.timeout_s)
-            r = await client.post(url, headers=headers, json=payload)
+            r = await client.post(url, headers=self._headers, json=payload)
             elapsed = _time.monotonic() - t0
             if r.status_code == 429:
-                logger.warning(f"Rate limited on {model} ({elapsed:.1f}s)")
+                backoff = _start_cooldown(model)
+                logger.warning(f"Rate limited on {model} ({elapsed:.1f}s), skipping it for {backoff:.0f}s")
                 return None
             if r.status_code >= 400:
                 logger.warning(f"Error {r.status_code} on {model} ({elapsed:.1f}s): {r.text[:200]}")
                 return None
-            data = r.json()
+            data = orjson.loads(r.content)
             text = data["candidates"][0]["content"]["parts"][0].get("text", "")
+            _clear_cooldown(model)
             logger.info(f"Gemini {model} responded in {elapsed:.1f}s")
             return text
         except Exception as e:
@@ -146,42 +300,56 @@ class GeminiPlanner:
             logger.warning(f"Exception calling {model} ({elapsed:.1f}s): {e}")
             return None
 
-    async def _race_models(self, models: List[str], prompt: str) -> tuple[Optional[str], str]:
-        """Race multiple models concurrently — return first successful response."""
-        if not models:
-            return None, "none"
-
-        async def _try(model: str) -> tuple[Optional[str], str]:
-            result = await self._call_gemini(model, prompt)
-            return result, model
-
-        tasks = [asyncio.create_task(_try(m)) for m in models[:2]]  # Race top 2
-        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    async def _race_models(self, models: Sequence[str], prompt: str,
+                           cache: bool = False) -> tuple[Optional[str], str]:
+        """Hedged race across the cascade — return the first successful response.
 
-        # Check if winner succeeded
-        for task in done:
-            text, model = task.result()
-            if text:
-                for p in pending:
-                    p.cancel()
-                return text, model
+        The top two models start together. Each further model starts as soon
+        as an in-flight call fails, or after _HEDGE_DELAY_S with no winner.
+        Calls still running when a winner returns are cancelled. Models in a
+        rate-limit cooldown are skipped. ``cache`` is passed to _call_gemini.
 
-        # Winner failed — wait for runner-up
-        for task in pending:
-            try:
-                text, model = await task
+        With ``settings.gemini_cascade_mode == "sequential"`` the models are
+        tried one at a time instead, in cascade order.
+        """
+        models = [m for m in models if not _is_cooling_down(m)]
+        if not models:
+            return None, "none"
+        if settings.gemini_cascade_mode == "sequential":
+            for model in models:
+                text = await self._call_gemini(model, prompt, cache)
                 if text:
                     return text, model
-            except asyncio.CancelledError:
-                pass
+            return None, "none"
 
-        # Both failed — try remaining models sequentially
-        for model in models[2:]:
-            text = await self._call_gemini(model, prompt)
-            if text:
-                return text, model
+        async def _try(model: str) -> tuple[Optional[str], str]:
+            result = await self._call_gemini(model, prompt, cache)
+            return result, model
 
-        return None, "none"
+        queue = list(models[2:])
+        pending = {asyncio.create_task(_try(m)) for m in models[:2]}  # Race top 2
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=_HEDGE_DELAY_S if queue else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # Nobody answered in time — hedge with the next model
+                    pending.add(asyncio.create_task(_try(queue.pop(0))))
+                    continue
+                for task in done:
+                    text, model = task.result()
+                    if text:
+                        return text, model
+                    if queue:
+                        # Failed call — start its replacement right away
+                        pending.add(asyncio.create_task(_try(queue.pop(0))))
+            return None, "none"
+        finally:
+            for task in pending:
+                task.cancel()
 
     # ---- Deterministic fallbacks ----
 
@@ -215,9 +383,9 @@ class GeminiPlanner:
 
 TASK: {nl_task}
 
-WORLD STATE: {json.dumps(telemetry, indent=2)}
+WORLD STATE: {_prompt_json(telemetry)}
 
-GOAL: {json.dumps(goal)}
+GOAL: {_prompt_json(goal)}
 
 Output STRICT JSON: {{"intent":"MOVE_TO|STOP|WAIT","params":{{...}},"rationale":"..."}}
 """
@@ -226,7 +394,7 @@ Output STRICT JSON: {{"intent":"MOVE_TO|STOP|WAIT","params":{{...}},"rationale":
         if text:
             try:
                 obj = _extract_json(text)
-                proposal = ActionProposal(**obj)
+                proposal = ActionProposal.model_validate(obj)
                 if proposal.intent == "MOVE_TO":
                     p = proposal.params or {}
                     p["x"] = float(p.get("x", goal.get("x", 0)))
@@ -245,13 +413,13 @@ Output STRICT JSON: {{"intent":"MOVE_TO|STOP|WAIT","params":{{...}},"rationale":
         if not self.api_key:
             return self._deterministic_plan(telemetry, goal)
 
-        goal_text = f"GOAL: {json.dumps(goal)}" if goal else "No specific goal."
+        goal_text = f"GOAL: {_prompt_json(goal)}" if goal else "No specific goal."
         bays_text = bay_directory_text(self._bays) if self._bays else ""
         prompt = f"""You are a robot planner in a 40x25m warehouse.
 
 INSTRUCTION: {instruction}
 
-STATE: {json.dumps(telemetry, indent=2)}
+STATE: {_prompt_json(telemetry)}
 
 {goal_text}
 
@@ -295,18 +463,24 @@ Output STRICT JSON:
 
     def _deterministic_analysis(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Rule-based telemetry analysis when LLM is unavailable."""
-        denials = [e for e in events if e.get("type") == "DECISION" and
-                   e.get("payload", {}).get("decision") == "DENIED"]
-        alerts = [e for e in events if e.get("type") == "ALERT"]
-        high_risk = [e for e in events if e.get("type") == "DECISION" and
-                     float(e.get("payload", {}).get("risk_score", 0)) > 0.7]
+        denials = alerts = high_risk = 0
+        for e in events:
+            etype = e.get("type")
+            if etype == "DECISION":
+                payload = e.get("payload") or _NO_PAYLOAD
+                if payload.get("decision") == "DENIED":
+                    denials += 1
+                if float(payload.get("risk_score", 0)) > 0.7:
+                    high_risk += 1
+            elif etype == "ALERT":
+                alerts += 1
         findings = []
         if denials:
-            findings.append(f"{len(denials)} governance denial(s) detected.")
+            findings.append(f"{denials} governance denial(s) detected.")
         if alerts:
-            findings.append(f"{len(alerts)} alert(s) raised during mission.")
+            findings.append(f"{alerts} alert(s) raised during mission.")
         if high_risk:
-            findings.append(f"{len(high_risk)} high-risk decision(s) (risk > 0.7).")
+            findings.append(f"{high_risk} high-risk decision(s) (risk > 0.7).")
         if not findings:
             findings.append("No anomalies detected. Mission telemetry looks nominal.")
         recommendations = []
@@ -318,8 +492,8 @@ Output STRICT JSON:
             recommendations.append("Continue current operational pattern.")
         return {
             "findings": findings,
-            "risk_summary": {"total_events": len(events), "denials": len(denials),
-                             "alerts": len(alerts), "high_risk_decisions": len(high_risk)},
+            "risk_summary": {"total_events": len(events), "denials": denials,
+                             "alerts": alerts, "high_risk_decisions": high_risk},
             "recommendations": recommendations,
             "model_used": "deterministic_fallback",
         }
@@ -329,15 +503,10 @@ Output STRICT JSON:
         desc_lower = scene_description.lower()
         hazards = []
         risk = 0.2
-        if any(w in desc_lower for w in ["human", "person", "worker", "people"]):
-            hazards.append({"type": "HUMAN", "severity": "HIGH", "description": "Human presence detected in scene"})
-            risk = max(risk, 0.8)
-        if any(w in desc_lower for w in ["obstacle", "box", "crate", "pallet", "block"]):
-            hazards.append({"type": "OBSTACLE", "severity": "MEDIUM", "description": "Physical obstacle in path"})
-            risk = max(risk, 0.5)
-        if any(w in desc_lower for w in ["spill", "wet", "slippery"]):
-            hazards.append({"type": "FLOOR_HAZARD", "severity": "MEDIUM", "description": "Floor hazard detected"})
-            risk = max(risk, 0.6)
+        for keywords, hazard, hazard_risk in _SCENE_HAZARDS:
+            if any(w in desc_lower for w in keywords):
+                hazards.append(dict(hazard))
+                risk = max(risk, hazard_risk)
         if not hazards:
             hazards.append({"type": "NONE", "severity": "LOW", "description": "No hazards detected"})
         return {
@@ -350,19 +519,34 @@ Output STRICT JSON:
     def _deterministic_failure(self, events: List[Dict[str, Any]], telemetry: Dict[str, Any]) -> Dict[str, Any]:
         """Rule-based failure detection when LLM is unavailable."""
         failures = []
-        denials = [e for e in events if e.get("type") == "DECISION" and
-                   e.get("payload", {}).get("decision") == "DENIED"]
-        if len(denials) >= 3:
+        denials = 0
+        recent: deque = deque(maxlen=5)  # last five TELEMETRY events
+        for e in events:
+            etype = e.get("type")
+            if etype == "DECISION":
+                if (e.get("payload") or _NO_PAYLOAD).get("decision") == "DENIED":
+                    denials += 1
+            elif etype == "TELEMETRY":
+                recent.append(e)
+        if denials >= 3:
             failures.append({"type": "REPEATED_DENIALS", "severity": "HIGH",
-                             "description": f"{len(denials)} governance denials — robot may be stuck in a denied loop.",
+                             "description": f"{denials} governance denials — robot may be stuck in a denied loop.",
                              "mitigation": "Re-plan route to avoid policy-violating zones."})
-        telem_events = [e for e in events if e.get("type") == "TELEMETRY"]
-        if len(telem_events) >= 5:
-            recent = telem_events[-5:]
-            positions = [(e.get("payload", {}).get("x", 0), e.get("payload", {}).get("y", 0)) for e in recent]
-            dx = max(p[0] for p in positions) - min(p[0] for p in positions)
-            dy = max(p[1] for p in positions) - min(p[1] for p in positions)
-            if dx < 0.3 and dy < 0.3:
+        if len(recent) == 5:
+            xmin = ymin = math.inf
+            xmax = ymax = -math.inf
+            for e in recent:
+                payload = e.get("payload") or _NO_PAYLOAD
+                x, y = payload.get("x", 0), payload.get("y", 0)
+                if x < xmin:
+                    xmin = x
+                if x > xmax:
+                    xmax = x
+                if y < ymin:
+                    ymin = y
+                if y > ymax:
+                    ymax = y
+            if xmax - xmin < 0.3 and ymax - ymin < 0.3:
                 failures.append({"type": "STUCK_ROBOT", "severity": "HIGH",
                                  "description": "Robot position has barely changed over recent telemetry samples.",
                                  "mitigation": "Issue a new plan or manually reposition."})
@@ -384,7 +568,7 @@ Output STRICT JSON:
         if not self.api_key:
             return self._deterministic_analysis(events)
         summary_events = events[-50:]
-        event_summary = json.dumps(summary_events, indent=1, default=str)
+        event_summary = _prompt_json([_compact_event(e) for e in summary_events])
         user_q = f"\nOPERATOR QUESTION: {question}" if question else ""
         prompt = f"""You are an AI safety analyst for an autonomous warehouse robot.
 
@@ -408,7 +592,7 @@ Output STRICT JSON:
 }}
 """
         cascade = self._get_cascade(preferred_model, fast=True)
-        text, model = await self._race_models(cascade, prompt)
+        text, model = await self._race_models(cascade, prompt, cache=True)
         if text:
             try:
                 obj = _extract_json(text)
@@ -426,7 +610,7 @@ Output STRICT JSON:
         """Analyze a scene (camera description or sensor data) for hazards."""
         if not self.api_key:
             return self._deterministic_scene(scene_description)
-        telem_ctx = f"\nCURRENT TELEMETRY: {json.dumps(telemetry, indent=1)}" if telemetry else ""
+        telem_ctx = f"\nCURRENT TELEMETRY: {_prompt_json(telemetry)}" if telemetry else ""
         prompt = f"""You are a computer vision safety module for a warehouse robot.
 
 Analyze the following scene description (simulating camera input) and identify:
@@ -447,7 +631,7 @@ Output STRICT JSON:
 }}
 """
         cascade = self._get_cascade(preferred_model, fast=True)
-        text, model = await self._race_models(cascade, prompt)
+        text, model = await self._race_models(cascade, prompt, cache=True)
         if text:
             try:
                 obj = _extract_json(text)
@@ -466,7 +650,7 @@ Output STRICT JSON:
         if not self.api_key:
             return self._deterministic_failure(events, telemetry)
         summary_events = events[-30:]
-        event_summary = json.dumps(summary_events, indent=1, default=str)
+        event_summary = _prompt_json([_compact_event(e) for e in summary_events])
         prompt = f"""You are a failure-analysis AI for an autonomous warehouse robot.
 
 Given the event history and current telemetry, detect:
@@ -476,7 +660,7 @@ Given the event history and current telemetry, detect:
 4. Sensor anomalies (unusual readings)
 5. Goal unreachability (robot cannot reach target)
 
-CURRENT TELEMETRY: {json.dumps(telemetry, indent=1)}
+CURRENT TELEMETRY: {_prompt_json(telemetry)}
 
 EVENT HISTORY ({len(summary_events)} recent of {len(events)} total):
 {event_summary}
@@ -489,7 +673,7 @@ Output STRICT JSON:
 }}
 """
         cascade = self._get_cascade(preferred_model, fast=True)
-        text, model = await self._race_models(cascade, prompt)
+        text, model = await self._race_models(cascade, prompt, cache=True)
         if text:
             try:
                 obj = _extract_json(text)
@@ -85,12 +85,15 @@ class GovernanceEngine:
             self._set_circuit_breaker(db, run_id, new_count)
             if new_count >= CONSECUTIVE_DENIAL_ESCALATION:
                 escalated = True
-                if "CIRCUIT_BREAKER" not in decision.reasons:
-                    decision.reasons.append(
+                reasons = decision.reasons
+                if "CIRCUIT_BREAKER" not in reasons:
+                    reasons = reasons + [
                         f"Circuit breaker: {new_count} consecutive denials — operator escalation required"
-                    )
-                if decision.decision == "DENIED":
-                    decision.decision = "NEEDS_REVIEW"
+                    ]
+                decision = decision.model_copy(update={
+                    "reasons": reasons,
+                    "decision": "NEEDS_REVIEW" if decision.decision == "DENIED" else decision.decision,
+                })
                 logger.warning(
                     "Run %s: circuit breaker triggered after %d consecutive denials",
                     run_id, new_count,
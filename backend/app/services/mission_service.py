@@ -14,6 +14,27 @@ from app.schemas.mission import MissionCreate, MissionUpdate
 from app.utils.ids import new_id
 from app.utils.time import utc_now
 
+# Pooled client for world lookups — keeps connections to the backend proxy
+# and simulator alive between mission writes
+_world_client: Optional[httpx.Client] = None
+
+
+def _get_world_client() -> httpx.Client:
+    global _world_client
+    if _world_client is None or _world_client.is_closed:
+        _world_client = httpx.Client(
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30),
+        )
+    return _world_client
+
+
+def close_world_client() -> None:
+    """Close the pooled world-lookup client (app shutdown)."""
+    global _world_client
+    if _world_client is not None:
+        _world_client.close()
+    _world_client = None
+
 
 class MissionService:
     """Manages mission CRUD, goal normalisation, and audit logging.
@@ -102,19 +123,17 @@ class MissionService:
                     world = None
                     try:
                         backend_url = f"http://127.0.0.1:{settings.backend_port}/sim/world"
-                        with httpx.Client(timeout=1.0) as client:
-                            r = client.get(backend_url)
-                            r.raise_for_status()
-                            world = r.json()
+                        r = _get_world_client().get(backend_url, timeout=1.0)
+                        r.raise_for_status()
+                        world = r.json()
                     except Exception:
                         world = None
                     if world is None:
                         try:
                             url = settings.sim_base_url.rstrip("/") + "/world"
-                            with httpx.Client(timeout=1.0) as client:
-                                r = client.get(url)
-                                r.raise_for_status()
-                                world = r.json()
+                            r = _get_world_client().get(url, timeout=1.0)
+                            r.raise_for_status()
+                            world = r.json()
                         except Exception:
                             world = None
                     if world is None:
@@ -200,10 +219,9 @@ class MissionService:
         # First try local backend proxy to sim
         try:
             backend_url = f"http://127.0.0.1:{settings.backend_port}/sim/world"
-            with httpx.Client(timeout=2.0) as client:
-                r = client.get(backend_url)
-                r.raise_for_status()
-                world = r.json()
+            r = _get_world_client().get(backend_url, timeout=2.0)
+            r.raise_for_status()
+            world = r.json()
         except Exception:
             world = None
 
@@ -211,10 +229,9 @@ class MissionService:
         if world is None:
             try:
                 url = settings.sim_base_url.rstrip("/") + "/world"
-                with httpx.Client(timeout=2.0) as client:
-                    r = client.get(url)
-                    r.raise_for_status()
-                    world = r.json()
+                r = _get_world_client().get(url, timeout=2.0)
+                r.raise_for_status()
+                world = r.json()
             except Exception:
                 world = None
 
@@ -279,19 +296,17 @@ class MissionService:
             world = None
             try:
                 backend_url = f"http://127.0.0.1:{settings.backend_port}/sim/world"
-                with httpx.Client(timeout=1.0) as client:
-                    r = client.get(backend_url)
-                    r.raise_for_status()
-                    world = r.json()
+                r = _get_world_client().get(backend_url, timeout=1.0)
+                r.raise_for_status()
+                world = r.json()
             except Exception:
                 world = None
             if world is None:
                 try:
                     url = settings.sim_base_url.rstrip("/") + "/world"
-                    with httpx.Client(timeout=1.0) as client:
-                        r = client.get(url)
-                        r.raise_for_status()
-                        world = r.json()
+                    r = _get_world_client().get(url, timeout=1.0)
+                    r.raise_for_status()
+                    world = r.json()
                 except Exception:
                     world = None
             if world is None:
@@ -733,7 +733,7 @@ class RunService:
                                     f"{nl_task}. Previous waypoint at ({blocked_wp.get('x')},{blocked_wp.get('y')}) "
                                     f"was blocked: {denial_context}. Plan an alternative route avoiding that area."
                                 )
-                                planner = self.agent._gemini_planner()
+                                planner = self.agent.gemini_planner
                                 new_plan = await planner.generate_plan(telemetry, replan_instruction, goal)
                                 new_wps = new_plan.get("waypoints", [])
                                 if new_wps:
@@ -1,10 +1,33 @@
 from __future__ import annotations
 
 import httpx
+import orjson
 from typing import Any, Dict, Optional
 from app.config import settings
 
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One pooled client for every adapter instance — run_service and the LLM
+# routes talk to the same simulator host
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client(headers: Dict[str, str]) -> httpx.AsyncClient:
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=5.0,
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=10,
+                keepalive_expiry=30,
+            ),
+        )
+    return _shared_client
+
+
 class SimAdapter:
     """Minimal HTTP adapter for the mock simulator.
 
@@ -12,6 +35,9 @@ class SimAdapter:
       - GET  /telemetry  -> current telemetry JSON
       - POST /command    -> execute a command
       - GET  /world      -> static world definition
+
+    Bodies are encoded and decoded with orjson on the bytes directly; a command
+    is posted and telemetry polled every tick.
     """
 
     def __init__(self, base_url: Optional[str] = None):
@@ -19,47 +45,43 @@ class SimAdapter:
         self._headers: Dict[str, str] = {}
         if getattr(settings, "sim_token", ""):
             self._headers["X-Sim-Token"] = settings.sim_token
-        # Shared client with explicit pool limits to prevent saturation
-        self._client = httpx.AsyncClient(
-            timeout=5.0,
-            headers=self._headers,
-            limits=httpx.Limits(
-                max_connections=20,
-                max_keepalive_connections=10,
-                keepalive_expiry=30,
-            ),
-        )
-
 
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        return _get_shared_client(self._headers)
 
     async def get_world(self) -> Dict[str, Any]:
         r = await self._client.get(f"{self.base_url}/world")
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
     async def get_telemetry(self) -> Dict[str, Any]:
         r = await self._client.get(f"{self.base_url}/telemetry")
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
     async def send_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
-        r = await self._client.post(f"{self.base_url}/command", json=command)
+        r = await self._client.post(
+            f"{self.base_url}/command", content=orjson.dumps(command), headers=_JSON_HEADERS
+        )
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
     async def reset_robot(self) -> Dict[str, Any]:
         """Reset robot to starting position in the simulator."""
         r = await self._client.post(f"{self.base_url}/reset")
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
     async def post_scenario(self, scenario: str) -> Dict[str, Any]:
         """Inject a deterministic scenario into the simulator."""
         r = await self._client.post(
-            f"{self.base_url}/scenario", json={"scenario": scenario}
+            f"{self.base_url}/scenario",
+            content=orjson.dumps({"scenario": scenario}),
+            headers=_JSON_HEADERS,
         )
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -0,0 +1,195 @@
+"""Tests for the agentic planner: tool execution and agent memory."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+from app.services.agentic_planner import (
+    _PROMPT_PREFIX, AgenticPlanner, AgentMemory, MemoryEntry, ToolExecutor,
+)
+from app.services.gemini_planner import is_stop_instruction
+
+
+TELEMETRY = {
+    "x": 5.0, "y": 5.0, "theta": 0.0, "speed": 0.0, "zone": "aisle",
+    "nearest_obstacle_m": 5.0, "human_detected": False, "human_conf": 0.0,
+    "human_distance_m": 999.0,
+}
+
+
+class TestToolExecutor:
+    def test_repeated_tool_call_reuses_observation(self):
+        ex = ToolExecutor(TELEMETRY)
+        params = {"intent": "MOVE_TO", "x": 6, "y": 6, "max_speed": 0.3}
+        first = ex.execute("check_policy", params)
+        assert first.startswith("Decision: APPROVED")
+        assert ex.execute("check_policy", dict(params)) is first
+
+    def test_non_dict_params_are_not_memoized(self):
+        ex = ToolExecutor(TELEMETRY)
+        assert ex.execute("get_world_state", "abc").startswith("Robot position")
+        assert ex.execute("check_policy", ["MOVE_TO"]).startswith("Tool error")
+        assert ex._observations == {}
+
+    def test_unknown_tool(self):
+        assert ToolExecutor(TELEMETRY).execute("teleport", {}) == "Unknown tool: teleport"
+
+
+def _entry(decision: str, step: int = 0) -> MemoryEntry:
+    return MemoryEntry(
+        timestamp=float(step), proposal_intent="MOVE_TO", proposal_params={"x": step},
+        governance_decision=decision, policy_hits=[], reasons=[f"r{step}"], policy_state="SAFE",
+        was_executed=decision == "APPROVED",
+    )
+
+
+class TestAgentMemory:
+    def test_window_evicts_oldest(self):
+        mem = AgentMemory(max_entries=3)
+        for i in range(5):
+            mem.add(_entry("APPROVED", i))
+        assert [e.proposal_params["x"] for e in mem.entries] == [2, 3, 4]
+        assert [e.proposal_params["x"] for e in mem.recent(2)] == [3, 4]
+        assert len(mem.recent(10)) == 3
+
+    def test_denial_count_uses_last_n(self):
+        mem = AgentMemory()
+        for d in ("DENIED", "NEEDS_REVIEW", "APPROVED", "DENIED", "APPROVED"):
+            mem.add(_entry(d))
+        assert mem.denial_count(5) == 3
+        assert mem.denial_count(2) == 1
+        assert mem.last_denial_reasons() == ["r0"]
+
+    def test_entry_text_rendered_once(self):
+        entry = _entry("DENIED", 1)
+        text = entry.to_text()
+        assert "DENIED" in text and "r1" in text
+        assert entry.to_text() is text
+
+
+class TestPreCheckReplan:
+    def test_repeated_denied_proposal_falls_back_without_more_llm_calls(self):
+        planner = AgenticPlanner()
+        # Over the aisle limit (0.5) — always denied by the pre-check
+        denied = json.dumps([{
+            "thought": "go fast", "action": "submit_action",
+            "action_input": {"intent": "MOVE_TO", "x": 8, "y": 5, "max_speed": 0.9},
+        }])
+        race = AsyncMock(return_value=(denied, "test-model"))
+        planner._llm._race_models = race
+
+        proposal, thoughts, model = asyncio.run(planner.propose(TELEMETRY, {"x": 8, "y": 5}, "go"))
+
+        # Attempt 1 denied, attempt 2 repeats it → deterministic plan, no attempt 3
+        assert race.await_count == 2
+        assert proposal.rationale.startswith("[agentic/fallback]")
+        assert proposal.params["max_speed"] <= 0.5
+        # The switch is recorded in the chain and in model_used
+        assert model == "deterministic"
+        assert thoughts[-1].action == "deterministic_fallback"
+        assert [t.step_number for t in thoughts] == list(range(1, len(thoughts) + 1))
+
+    def test_submit_reuses_check_policy_decision(self, monkeypatch):
+        import app.services.agentic_planner as ap
+
+        planner = AgenticPlanner()
+        action = {"intent": "MOVE_TO", "x": 8.0, "y": 5.0, "max_speed": 0.3}
+        steps = json.dumps([
+            {"thought": "check", "action": "check_policy", "action_input": action},
+            {"thought": "go", "action": "submit_action", "action_input": {**action, "rationale": "ok"}},
+        ])
+        planner._llm._race_models = AsyncMock(return_value=(steps, "test-model"))
+        calls = []
+        real = ap.evaluate_policies
+        monkeypatch.setattr(ap, "evaluate_policies", lambda *a: calls.append(a) or real(*a))
+
+        proposal, _, _ = asyncio.run(planner.propose(TELEMETRY, {"x": 8, "y": 5}, "go"))
+
+        assert proposal.params == {"x": 8.0, "y": 5.0, "max_speed": 0.3}
+        assert len(calls) == 1
+
+
+class TestSystemPrompt:
+    def test_static_prefix_leads_every_prompt(self):
+        planner = AgenticPlanner()
+        first = planner._build_system_prompt(TELEMETRY, {"x": 8, "y": 5}, "go")
+        replan = planner._build_system_prompt(
+            {**TELEMETRY, "x": 6.0}, {"x": 2, "y": 2}, "other", denial_feedback="Pre-check DENIED",
+        )
+        assert first.startswith(_PROMPT_PREFIX) and replan.startswith(_PROMPT_PREFIX)
+        assert "Pre-check DENIED" in replan[len(_PROMPT_PREFIX):]
+
+
+class TestStopFastPath:
+    def test_mission_titled_stop_is_planned_normally(self):
+        # The run loop passes the mission title as nl_task; only operator
+        # routes may short-circuit a bare "Stop" into a STOP proposal.
+        planner = AgenticPlanner()
+        race = AsyncMock(return_value=(None, "none"))
+        planner._llm._race_models = race
+
+        proposal, _, model = asyncio.run(planner.propose(TELEMETRY, {"x": 8, "y": 5}, "Stop"))
+
+        race.assert_awaited()
+        assert model != "fastpath"
+        assert "fastpath" not in proposal.rationale
+
+    def test_operator_stop_skips_llm(self, monkeypatch):
+        from app.api import routes_llm
+
+        sim = AsyncMock()
+        sim.get_telemetry.return_value = TELEMETRY
+        sim.get_world.return_value = {"bays": []}
+        sim.send_command.return_value = {"ok": True}
+        monkeypatch.setattr(routes_llm, "_sim", sim)
+        race = AsyncMock(return_value=(None, "none"))
+        monkeypatch.setattr(routes_llm._get_planner(), "_race_models", race)
+
+        plan = asyncio.run(routes_llm.generate_plan(routes_llm.PlanRequest(instruction=" Halt! ")))
+        agentic = asyncio.run(routes_llm.agentic_propose(
+            routes_llm.AgenticProposeRequest(instruction="stop"),
+        ))
+        execute = asyncio.run(routes_llm.execute_plan(
+            routes_llm.ExecuteRequest(instruction="E-Stop", waypoints=[{"x": 9.0, "y": 9.0}]),
+        ))
+
+        assert plan.waypoints == [] and plan.all_approved
+        assert agentic.proposal["intent"] == "STOP" and agentic.model_used == "fastpath"
+        assert [s.executed for s in execute.steps] == [True]
+        sim.send_command.assert_awaited_once_with({"intent": "STOP", "params": {}})
+        race.assert_not_awaited()
+
+    def test_stop_matching_is_exact(self):
+        assert is_stop_instruction("E-Stop")
+        assert not is_stop_instruction("stop by bay B-03 then continue")
+
+
+class TestAgentRouterThoughtChain:
+    def test_concurrent_runs_do_not_mix_chains(self, monkeypatch):
+        from app.config import settings
+        from app.schemas.governance import ActionProposal
+        from app.services.agent_service import AgentRouter
+        from app.services.agentic_planner import ThoughtStep
+
+        monkeypatch.setattr(settings, "llm_enabled", True)
+        monkeypatch.setattr(settings, "llm_provider", "agentic")
+        router = AgentRouter()
+
+        class _Planner:
+            async def propose(self, telemetry, goal, nl_task, last_governance, world):
+                await asyncio.sleep(0.02 if nl_task == "A" else 0.01)
+                step = ThoughtStep(step_number=1, thought=f"{nl_task}-thought", action="submit_action")
+                return ActionProposal(intent="WAIT", params={}, rationale=""), [step], "stub"
+
+        router._agentic = _Planner()
+
+        async def run(task):
+            await router.propose(TELEMETRY, {"x": 1, "y": 1}, task)
+            return [s["thought"] for s in router.last_thought_chain]
+
+        async def both():
+            return await asyncio.gather(run("A"), run("B"))
+
+        assert asyncio.run(both()) == [["A-thought"], ["B-thought"]]
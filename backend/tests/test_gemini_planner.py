@@ -0,0 +1,273 @@
+"""Tests for GeminiPlanner's request layer (no network)."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.services import gemini_planner
+from app.services.gemini_planner import GeminiPlanner, _compact_event, _extract_json, _prompt_json
+
+
+@pytest.fixture(autouse=True)
+def _empty_response_cache():
+    gemini_planner._response_cache.clear()
+    gemini_planner._cooldown_until.clear()
+    gemini_planner._cooldown_backoff.clear()
+    yield
+    gemini_planner._response_cache.clear()
+    gemini_planner._cooldown_until.clear()
+    gemini_planner._cooldown_backoff.clear()
+
+
+class TestResponseCache:
+    def test_repeated_prompt_hits_cache(self):
+        planner = GeminiPlanner()
+        planner._post_gemini = AsyncMock(return_value='{"intent": "WAIT"}')
+
+        async def run():
+            first = await planner._call_gemini("m", "prompt", cache=True)
+            again = await planner._call_gemini("m", "prompt", cache=True)
+            other = await planner._call_gemini("m2", "prompt", cache=True)
+            return first, again, other
+
+        first, again, other = asyncio.run(run())
+        assert first == again == other == '{"intent": "WAIT"}'
+        assert planner._post_gemini.await_count == 2  # once per model
+
+    def test_concurrent_identical_calls_share_one_request(self):
+        planner = GeminiPlanner()
+
+        async def slow_post(model, prompt):
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        planner._post_gemini = AsyncMock(side_effect=slow_post)
+
+        async def run():
+            return await asyncio.gather(*(planner._call_gemini("m", "p", cache=True) for _ in range(3)))
+
+        assert asyncio.run(run()) == ["ok", "ok", "ok"]
+        assert planner._post_gemini.await_count == 1
+
+    def test_waiter_retries_when_owner_is_cancelled(self):
+        planner = GeminiPlanner()
+
+        async def slow_post(model, prompt):
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        planner._post_gemini = AsyncMock(side_effect=slow_post)
+
+        async def run():
+            owner = asyncio.ensure_future(planner._call_gemini("m", "p", cache=True))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(planner._call_gemini("m", "p", cache=True))
+            await asyncio.sleep(0)
+            owner.cancel()
+            return await waiter, owner.cancelled()
+
+        assert asyncio.run(run()) == ("ok", True)
+        assert planner._post_gemini.await_count == 2
+
+    def test_cached_response_expires(self, monkeypatch):
+        planner = GeminiPlanner()
+        planner._post_gemini = AsyncMock(return_value="ok")
+        now = [100.0]
+        monkeypatch.setattr(gemini_planner, "_time", SimpleNamespace(monotonic=lambda: now[0]))
+
+        async def call():
+            return await planner._call_gemini("m", "p", cache=True)
+
+        asyncio.run(call())
+        now[0] += gemini_planner._RESPONSE_TTL_S + 0.1
+        asyncio.run(call())
+        assert planner._post_gemini.await_count == 2
+
+    def test_failures_are_not_cached(self):
+        planner = GeminiPlanner()
+        planner._post_gemini = AsyncMock(side_effect=[None, "ok"])
+
+        async def run():
+            return [await planner._call_gemini("m", "p", cache=True) for _ in range(2)]
+
+        assert asyncio.run(run()) == [None, "ok"]
+
+    def test_uncached_calls_always_go_upstream(self):
+        planner = GeminiPlanner()
+        planner._post_gemini = AsyncMock(return_value="ok")
+
+        async def run():
+            return [await planner._call_gemini("m", "p") for _ in range(2)]
+
+        assert asyncio.run(run()) == ["ok", "ok"]
+        assert planner._post_gemini.await_count == 2
+        assert not gemini_planner._response_cache
+
+
+class TestRaceModels:
+    @staticmethod
+    def _planner(behaviour):
+        """behaviour: model → (delay_s, text)."""
+        planner = GeminiPlanner()
+        started = []
+
+        async def call(model, prompt, cache=False):
+            started.append(model)
+            delay, text = behaviour[model]
+            await asyncio.sleep(delay)
+            return text
+
+        planner._call_gemini = call
+        return planner, started
+
+    def test_failed_call_starts_next_model(self):
+        planner, started = self._planner({"a": (1.0, "late"), "b": (0.0, None), "c": (0.0, "ok")})
+        assert asyncio.run(planner._race_models(["a", "b", "c"], "p")) == ("ok", "c")
+        assert sorted(started) == ["a", "b", "c"]
+
+    def test_slow_models_are_hedged(self, monkeypatch):
+        monkeypatch.setattr(gemini_planner, "_HEDGE_DELAY_S", 0.01)
+        planner, _ = self._planner({"a": (1.0, "a"), "b": (1.0, "b"), "c": (0.0, "c")})
+        assert asyncio.run(planner._race_models(["a", "b", "c"], "p")) == ("c", "c")
+
+    def test_all_fail(self):
+        planner, started = self._planner({"a": (0.0, None), "b": (0.0, None), "c": (0.0, None)})
+        assert asyncio.run(planner._race_models(["a", "b", "c"], "p")) == (None, "none")
+        assert sorted(started) == ["a", "b", "c"]
+
+    def test_sequential_mode_tries_one_model_at_a_time(self, monkeypatch):
+        monkeypatch.setattr(gemini_planner.settings, "gemini_cascade_mode", "sequential")
+        planner, started = self._planner({"a": (0.0, None), "b": (0.0, "b"), "c": (0.0, "c")})
+        assert asyncio.run(planner._race_models(["a", "b", "c"], "p")) == ("b", "b")
+        assert started == ["a", "b"]
+
+    def test_unknown_cascade_mode_is_rejected(self):
+        from pydantic import ValidationError
+
+        from app.config import Settings
+
+        with pytest.raises(ValidationError):
+            Settings(gemini_cascade_mode="sequental")
+
+
+class TestRateLimitCooldown:
+    @staticmethod
+    def _post_status(monkeypatch, status):
+        client = AsyncMock()
+        client.post.return_value = httpx.Response(
+            status, json={"candidates": [{"content": {"parts": [{"text": "ok"}]}}]})
+        monkeypatch.setattr(gemini_planner, "_get_shared_client", lambda timeout: client)
+        return asyncio.run(GeminiPlanner()._post_gemini("m", "p"))
+
+    def test_backoff_doubles_and_resets(self, monkeypatch):
+        assert self._post_status(monkeypatch, 429) is None
+        assert gemini_planner._cooldown_backoff["m"] == gemini_planner._COOLDOWN_MIN_S
+        assert gemini_planner._is_cooling_down("m")
+        self._post_status(monkeypatch, 429)
+        assert gemini_planner._cooldown_backoff["m"] == 2 * gemini_planner._COOLDOWN_MIN_S
+        assert self._post_status(monkeypatch, 200) == "ok"
+        assert not gemini_planner._is_cooling_down("m")
+        assert "m" not in gemini_planner._cooldown_backoff
+
+    def test_race_skips_cooling_models(self):
+        planner, started = TestRaceModels._planner({"a": (0.0, "a"), "b": (0.0, "b")})
+        gemini_planner._start_cooldown("a")
+        assert asyncio.run(planner._race_models(["a", "b"], "p")) == ("b", "b")
+        assert started == ["b"]
+        gemini_planner._start_cooldown("b")
+        assert asyncio.run(planner._race_models(["a", "b"], "p")) == (None, "none")
+
+
+class TestExtractJson:
+    def test_plain_and_fenced(self):
+        assert _extract_json('{"a": 1}') == {"a": 1}
+        assert _extract_json('```json\n[{"a": "}"}]\n```') == [{"a": "}"}]
+
+    def test_skips_non_json_brackets_and_trailing_text(self):
+        assert _extract_json('[note] here: {"intent": "WAIT"} then {x}') == {"intent": "WAIT"}
+
+    def test_no_json(self):
+        with pytest.raises(ValueError):
+            _extract_json("no json here {")
+
+
+def _decision(decision, risk):
+    return {"type": "DECISION", "payload": {"decision": decision, "risk_score": risk}}
+
+
+def _telemetry(x, y):
+    return {"type": "TELEMETRY", "payload": {"x": x, "y": y}}
+
+
+class TestDeterministicFallbacks:
+    def test_analysis_counts(self):
+        events = [
+            _decision("DENIED", 0.9),
+            _decision("APPROVED", 0.8),
+            _decision("DENIED", 0.1),
+            {"type": "ALERT", "payload": {}},
+            _telemetry(1, 1),
+        ]
+        summary = GeminiPlanner()._deterministic_analysis(events)["risk_summary"]
+        assert summary == {"total_events": 5, "denials": 2, "alerts": 1, "high_risk_decisions": 2}
+
+    def test_failure_uses_last_five_telemetry_samples(self):
+        planner = GeminiPlanner()
+        moving = [_telemetry(i, 0) for i in range(5)]
+        stuck = [_telemetry(10, 10) for _ in range(5)]
+        denied = [_decision("DENIED", 0.5)] * 3
+
+        def types(events):
+            return [f["type"] for f in planner._deterministic_failure(events, {})["failures"]]
+
+        assert types(moving) == ["NONE"]
+        assert types(moving + stuck) == ["STUCK_ROBOT"]
+        assert types(stuck[:4]) == ["NONE"]
+        assert types(denied + stuck + moving) == ["REPEATED_DENIALS"]
+
+    def test_scene_keywords(self):
+        planner = GeminiPlanner()
+        result = planner._deterministic_scene("A Worker near a wet pallet")
+        assert [h["type"] for h in result["hazards"]] == ["HUMAN", "OBSTACLE", "FLOOR_HAZARD"]
+        assert result["risk_score"] == 0.8
+        assert result["recommended_action"] == "STOP"
+        clear = planner._deterministic_scene("empty aisle")
+        assert clear["hazards"][0]["type"] == "NONE" and clear["recommended_action"] == "PROCEED"
+
+
+class TestPromptJson:
+    def test_compact_output(self):
+        assert _prompt_json({"a": [1, 2], 3: "x"}) == '{"a":[1,2],"3":"x"}'
+
+    def test_compact_event_drops_ids_and_hashes(self):
+        event = {"id": "e1", "run_id": "r1", "ts": "2025-01-01T00:00:00", "type": "DECISION",
+                 "payload": {"decision": "DENIED", "reason": "human nearby"},
+                 "hash": "a" * 64, "prev_hash": "0" * 64}
+        assert _compact_event(event) == {"ts": "2025-01-01T00:00:00", "type": "DECISION",
+                                         "payload": {"decision": "DENIED", "reason": "human nearby"}}
+
+
+class TestCascade:
+    def test_primary_first_without_duplicates(self):
+        cascade = gemini_planner._build_cascade("gemini-2.0-flash")
+        assert cascade[0] == "gemini-2.0-flash"
+        assert sorted(cascade) == sorted(set(gemini_planner.MODEL_CASCADE))
+        assert gemini_planner._build_cascade("custom")[1:] == tuple(dict.fromkeys(gemini_planner.MODEL_CASCADE))
+
+    def test_preferred_model_moves_to_front(self):
+        planner = GeminiPlanner()
+        cascade = planner._get_cascade("gemini-2.0-flash")
+        assert cascade[0] == "gemini-2.0-flash" and cascade.count("gemini-2.0-flash") == 1
+
+
+class TestFallbackPayloads:
+    def test_missing_or_null_payloads(self):
+        planner = GeminiPlanner()
+        events = [{"type": "DECISION"}, {"type": "DECISION", "payload": None}, {"type": "TELEMETRY"}] * 5
+        assert planner._deterministic_analysis(events)["risk_summary"]["denials"] == 0
+        assert [f["type"] for f in planner._deterministic_failure(events, {})["failures"]] == ["STUCK_ROBOT"]
@@ -93,3 +93,63 @@ def test_multiple_policy_hits():
     assert decision.decision in ("DENIED", "NEEDS_REVIEW")
     assert len(decision.policy_hits) >= 2  # At least SAFE_SPEED + OBSTACLE or HUMAN
     assert decision.risk_score >= 0.85
+
+
+def test_approved_safe_decision_is_shared_and_frozen():
+    import pytest
+    from pydantic import ValidationError
+
+    telemetry = {"x": 5, "y": 5, "zone": "aisle", "nearest_obstacle_m": 5.0, "human_detected": False, "human_conf": 0.0}
+    proposal = ActionProposal(intent="MOVE_TO", params={"x": 6, "y": 6, "max_speed": 0.3})
+    first = evaluate_policies(telemetry, proposal)
+    assert evaluate_policies(telemetry, proposal) is first
+    with pytest.raises(ValidationError):
+        first.decision = "DENIED"
+
+
+def test_circuit_breaker_escalates_frozen_decision():
+    from unittest.mock import MagicMock
+    from app.services.governance_engine import GovernanceEngine, CONSECUTIVE_DENIAL_ESCALATION
+
+    engine = GovernanceEngine()
+    engine._set_circuit_breaker = MagicMock()
+    engine._consecutive_denials["run_cb"] = CONSECUTIVE_DENIAL_ESCALATION - 1
+    telemetry = {"x": 5, "y": 5, "zone": "aisle", "nearest_obstacle_m": 5.0, "human_detected": False, "human_distance_m": 2.0}
+    proposal = ActionProposal(intent="MOVE_TO", params={"x": 6, "y": 6, "max_speed": 0.45})
+    assert evaluate_policies(telemetry, proposal).decision == "DENIED"
+    decision = engine.evaluate_and_record(MagicMock(), "run_cb", telemetry, proposal)
+    assert decision.decision == "NEEDS_REVIEW"
+    assert any(r.startswith("Circuit breaker") for r in decision.reasons)
+
+
+def test_policy_bits_cover_policy_catalogue():
+    from app.policies.rules_python import POLICY_BITS, HARD_FAIL_MASK, HARD_FAIL_POLICIES, SOFT_FAIL_POLICIES
+
+    assert set(POLICY_BITS) == HARD_FAIL_POLICIES | SOFT_FAIL_POLICIES
+    assert len(set(POLICY_BITS.values())) == len(POLICY_BITS)
+    assert HARD_FAIL_MASK == sum(POLICY_BITS[p] for p in HARD_FAIL_POLICIES)
+
+
+def test_decision_bitmask_drives_simple_agent_slowdown():
+    from app.policies.rules_python import POLICY_BITS
+    from app.services.agent_service import SimpleAgent
+
+    telemetry = {"x": 1, "y": 1, "zone": "aisle", "nearest_obstacle_m": 2.0, "human_detected": False, "human_conf": 0.0}
+    decision = evaluate_policies(telemetry, ActionProposal(intent="MOVE_TO", params={"x": 10, "y": 10, "max_speed": 0.9}))
+    assert decision.policy_bitmask == sum(POLICY_BITS[p] for p in decision.policy_hits)
+
+    proposal = SimpleAgent().propose(telemetry, {"x": 10, "y": 10}, decision.model_dump())
+    assert proposal.params["max_speed"] == 0.2
+
+
+def test_policy_limits_follow_module_constants(monkeypatch):
+    from app.policies import rules_python
+
+    telemetry = {"x": 5, "y": 5, "zone": "aisle", "nearest_obstacle_m": 1.0, "human_detected": False, "human_conf": 0.0}
+    proposal = ActionProposal(intent="MOVE_TO", params={"x": 6, "y": 6, "max_speed": 0.3})
+    assert "OBSTACLE_CLEARANCE_03" not in evaluate_policies(telemetry, proposal).policy_hits
+
+    monkeypatch.setattr(rules_python, "MIN_OBSTACLE_CLEARANCE_M", 2.0)
+    decision = evaluate_policies(telemetry, proposal)
+    assert "OBSTACLE_CLEARANCE_03" in decision.policy_hits
+    assert any("2.0" in r for r in decision.reasons)
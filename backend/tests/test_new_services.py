@@ -213,3 +213,110 @@ def test_memory_search_api(client):
 def test_cross_run_learning_api(client):
     r = client.get("/agent/cross-run-learning")
     assert r.status_code == 200
+
+
+# ── Compliance audit chain ──
+
+def test_compliance_audit_chain_hash_format():
+    """Chain hashes stay sha256(sorted JSON + previous hex hash) and detect tampering."""
+    import hashlib
+    from app.services.compliance_report import GENESIS_HASH, ComplianceReportService
+
+    svc = ComplianceReportService()
+    events = [
+        {"id": f"d{i}", "timestamp": f"2025-01-01T00:00:0{i}Z", "action_type": "MOVE_TO",
+         "approved": i % 2 == 0, "risk_score": 0.1 * i,
+         "violations": [{"policy_id": "SAFE_SPEED_01", "severity": "HIGH"}] if i % 2 else []}
+        for i in range(4)
+    ]
+    entries = svc._build_audit_chain(events)
+    first = entries[0]
+    data = {"timestamp": first.timestamp, "decision_id": first.decision_id,
+            "action_type": first.action_type, "approved": first.approved,
+            "risk_score": first.risk_score, "violations": first.violations}
+    expected = hashlib.sha256((json.dumps(data, sort_keys=True) + GENESIS_HASH).encode()).hexdigest()
+    assert first.hash == expected
+    assert svc._verify_chain(entries)
+
+    entries[2] = entries[2].model_copy(update={"risk_score": 0.0})
+    assert not svc._verify_chain(entries)
+
+
+def test_compliance_metrics():
+    from app.services.compliance_report import ComplianceReportService
+
+    events = [
+        {"approved": True, "risk_score": 0.1},
+        {"approved": False, "risk_score": 0.9, "violations": [
+            {"policy_id": "HUMAN_PROXIMITY_02", "severity": "HIGH"},
+            {"policy_id": "SAFE_SPEED_01", "severity": "MEDIUM"},
+        ]},
+        {"approved": False, "risk_score": 0.5, "violations": [{"policy_id": "HUMAN_PROXIMITY_02"}]},
+    ]
+    m = ComplianceReportService()._calculate_metrics(events)
+    assert (m.total_decisions, m.approved, m.denied) == (3, 1, 2)
+    assert m.avg_risk_score == 0.5 and m.max_risk_score == 0.9
+    assert m.violations_by_policy == {"HUMAN_PROXIMITY_02": 2, "SAFE_SPEED_01": 1}
+    assert m.critical_violations == 1
+
+
+def test_compliance_chain_extends_incrementally():
+    from app.services.compliance_report import ComplianceReportService
+
+    def ev(i):
+        return {"id": f"e{i}", "timestamp": f"2025-01-01T00:00:{i:02d}Z",
+                "action_type": "move_to", "approved": True, "risk_score": 0.1}
+
+    svc = ComplianceReportService()
+    first = svc.generate_report("run-1", [ev(i) for i in range(3)])
+    events = [ev(i) for i in range(5)]
+    second = svc.generate_report("run-1", events)
+
+    assert second.chain_valid
+    assert second.audit_entries[:3] == first.audit_entries
+    assert second.audit_entries == svc._build_audit_chain(events)
+
+    # A different history for the same run rebuilds from genesis
+    rewritten = [ev(i) for i in range(1, 4)]
+    third = svc.generate_report("run-1", rewritten)
+    assert third.audit_entries == svc._build_audit_chain(rewritten)
+
+
+def test_compliance_chain_cache_rejects_edits_and_missing_ids():
+    from app.services.compliance_report import ComplianceReportService
+
+    def ev(i, **kw):
+        return {"id": f"e{i}", "timestamp": f"2025-01-01T00:00:{i:02d}Z",
+                "action_type": "move_to", "approved": True, "risk_score": 0.1, **kw}
+
+    svc = ComplianceReportService()
+    svc.generate_report("run-1", [ev(0), ev(1)])
+    # Same ids, but the last cached event was edited
+    edited = [ev(0), ev(1, approved=False), ev(2)]
+    report = svc.generate_report("run-1", edited)
+    assert report.audit_entries == svc._build_audit_chain(edited)
+    assert report.audit_entries[1].approved is False
+
+    # An earlier event in the prefix was rewritten (new stored hash)
+    svc.generate_report("run-3", [ev(0, event_hash="h0"), ev(1, event_hash="h1")])
+    rewritten = [ev(0, event_hash="h0x", approved=False), ev(1, event_hash="h1"), ev(2)]
+    report = svc.generate_report("run-3", rewritten)
+    assert report.audit_entries == svc._build_audit_chain(rewritten)
+    assert report.audit_entries[0].approved is False
+
+    # Events without ids are never cached, so later edits always show
+    anon = [{"timestamp": "t0", "risk_score": 0.1}, {"timestamp": "t1", "risk_score": 0.2}]
+    svc.generate_report("run-2", anon)
+    assert "run-2" not in svc._chains
+    anon[0]["risk_score"] = 0.9
+    assert svc.generate_report("run-2", anon).audit_entries[0].risk_score == 0.9
+
+
+def test_compliance_chain_valid_for_integer_risk_scores():
+    """Audit entries keep the exact values that were hashed (no int → float coercion)."""
+    from app.services.compliance_report import ComplianceReportService
+
+    report = ComplianceReportService().generate_report(
+        "run-int", [{"id": "e0", "timestamp": "t0", "approved": True, "risk_score": 0}],
+    )
+    assert report.chain_valid